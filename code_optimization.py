@@ -6,15 +6,19 @@ program optimization system. It handles argument parsing, input validation,
 orchestrator initialization, and results display.
 """
 
-import argparse
 import logging
 import os
+import re
+import stat
 import sys
 import time
-from pathlib import Path
+from types import SimpleNamespace
 
-from code_optimization.orchestrator import OptimizationOrchestrator
-from code_optimization.core.program_manager import ProgramManager
+# Cheap to create; handlers and levels are only set up by configure_logging()
+logger = logging.getLogger(__name__)
+
+# Separator line used between the phases of the CLI log output
+_BANNER = "=" * 60
 
 
 # ANSI color codes
@@ -46,18 +50,44 @@ class ColoredFormatter(logging.Formatter):
         logging.CRITICAL: Colors.BOLD_RED,
     }
     
-    def format(self, record: logging.LogRecord) -> str:
-        # Get the severity color
-        level_color = self.LEVEL_COLORS.get(record.levelno, Colors.RESET)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Colored "[LEVEL]" part for each known level, built once
+        self._level_parts = {
+            level: f"{color}[{logging.getLevelName(level)}]{Colors.RESET}"
+            for level, color in self.LEVEL_COLORS.items()
+        }
+        # (second, formatted timestamp) of the last record formatted
+        self._last_time = (None, "")
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        # Without a datefmt the default format includes milliseconds
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
         
-        # Format datetime
-        datetime_str = self.formatTime(record, self.datefmt)
+        # Records logged within the same second share one strftime result
+        second = int(record.created)
+        last_second, last_str = self._last_time
+        if second != last_second:
+            last_str = time.strftime(datefmt, self.converter(second))
+            self._last_time = (second, last_str)
+        return last_str
+    
+    def format(self, record: logging.LogRecord) -> str:
+        # Get the colored severity part
+        severity_part = self._level_parts.get(record.levelno)
+        if severity_part is None:
+            severity_part = f"{Colors.RESET}[{record.levelname}]{Colors.RESET}"
         
         # Build the colored log message
-        green_part = f"{Colors.GREEN}[{datetime_str}] [{record.name}]{Colors.RESET}"
-        severity_part = f"{level_color}[{record.levelname}]{Colors.RESET}"
-        
-        return f"{green_part} {severity_part} {record.getMessage()}"
+        datetime_str = self.formatTime(record, self.datefmt)
+        return (
+            f"{Colors.GREEN}[{datetime_str}] [{record.name}]{Colors.RESET} "
+            f"{severity_part} {record.getMessage()}"
+        )
+
+
+_logging_configured = False
 
 
 def configure_logging():
@@ -69,7 +99,14 @@ def configure_logging():
     - WARNING: Warning messages only
     - ERROR: Error messages only
     - CRITICAL: Critical errors only
+
+    Only the first call has any effect.
     """
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
+
     # Get log level from environment variable, default to INFO
     log_level_str = os.environ.get('LOG_LEVEL', 'INFO').upper()
     
@@ -91,39 +128,37 @@ def configure_logging():
     handler = logging.StreamHandler()
     handler.setFormatter(formatter)
     
-    # Configure root logger
+    # Configure root logger directly (no basicConfig). Levels are assigned
+    # without setLevel(); the level cache is cleared once below.
     root_logger = logging.getLogger()
-    root_logger.setLevel(log_level)
+    root_logger.level = log_level
     root_logger.handlers.clear()  # Remove any existing handlers
     root_logger.addHandler(handler)
+
+    quiet_levels = {
+        # turn off low-level logging
+        "boto": logging.ERROR,
+        "boto3": logging.ERROR,
+        "botocore": logging.ERROR,
+        "urllib3": logging.ERROR,
+        # Suppress OpenTelemetry context errors (caused by async context propagation
+        # issues in Strands Swarm multi-agent pattern - these are cosmetic errors)
+        "opentelemetry.context": logging.CRITICAL,
+    }
+    
+    # Assign levels directly and invalidate the logger level cache once,
+    # rather than once per setLevel() call
+    for name, level in quiet_levels.items():
+        logging.getLogger(name).level = level
+    logging.Logger.manager._clear_cache()
     
     # Log the configuration
-    logger = logging.getLogger(__name__)
     logger.debug("Logging configured with level: %s", log_level_str)
 
-    # turn off low-level logging
-    for noisy in ["boto", "boto3", "botocore", "urllib3"]:
-        logging.getLogger(noisy).setLevel(logging.ERROR)
-    
-    # Suppress OpenTelemetry context errors (caused by async context propagation
-    # issues in Strands Swarm multi-agent pattern - these are cosmetic errors)
-    logging.getLogger("opentelemetry.context").setLevel(logging.CRITICAL)
-
-# Configure logging before creating logger
-configure_logging()
-logger = logging.getLogger(__name__)
 
+_DESCRIPTION = 'Program Optimization System - Iteratively improve Python programs'
 
-def parse_arguments():
-    """Parse command-line arguments.
-    
-    Returns:
-        argparse.Namespace: Parsed arguments.
-    """
-    parser = argparse.ArgumentParser(
-        description='Program Optimization System - Iteratively improve Python programs',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_EPILOG = """
 Example usage:
   python code_optimization.py \\
       --initial-program examples/function_minimization/initial_program.py \\
@@ -139,37 +174,135 @@ The initial program must contain EVOLVE-BLOCK markers:
 The evaluator must provide an evaluate(program_path: str) function
 that returns metrics including 'combined_score'.
         """
+
+_USAGE = """usage: code_optimization.py [-h] --initial-program INITIAL_PROGRAM --evaluator
+                            EVALUATOR --iterations ITERATIONS
+                            [--output-dir OUTPUT_DIR]"""
+
+_STATIC_HELP = f"""{_USAGE}
+
+{_DESCRIPTION}
+
+options:
+  -h, --help            show this help message and exit
+  --initial-program INITIAL_PROGRAM
+                        Path to the initial Python program with EVOLVE-BLOCK
+                        markers
+  --evaluator EVALUATOR
+                        Path to the evaluator module with evaluate() function
+  --iterations ITERATIONS
+                        Number of optimization iterations to run
+  --output-dir OUTPUT_DIR
+                        Directory for output files (default: creates
+                        timestamped directory)
+{_EPILOG.rstrip()}"""
+
+
+# Maps each command-line flag to its attribute name and value type
+_OPTIONS = {
+    '--initial-program': ('initial_program', str),
+    '--evaluator': ('evaluator', str),
+    '--iterations': ('iterations', int),
+    '--output-dir': ('output_dir', str),
+}
+
+_REQUIRED_OPTIONS = ('--initial-program', '--evaluator', '--iterations')
+
+_HELP_FLAGS = ('-h', '--help')
+
+# Arguments argparse treats as values rather than options even though they
+# start with '-'
+_NEGATIVE_NUMBER_RE = re.compile(r'^-\d+$|^-\d*\.\d+$')
+
+
+def _argument_error(message: str) -> None:
+    """Print usage and an error message to stderr and exit with status 2."""
+    print(_USAGE, file=sys.stderr)
+    print(f"code_optimization.py: error: {message}", file=sys.stderr)
+    sys.exit(2)
+
+
+def _is_option(arg: str) -> bool:
+    """Check whether an argument is in option position, as argparse decides it."""
+    return (
+        arg.startswith('-') and arg != '-' and ' ' not in arg
+        and not _NEGATIVE_NUMBER_RE.match(arg)
     )
+
+
+def _resolve_flag(flag: str):
+    """Return the flag that flag names, allowing unambiguous long-option
+    prefixes as argparse does, or None if it names no flag."""
+    if flag in _OPTIONS or flag in _HELP_FLAGS:
+        return flag
+    if flag.startswith('--') and len(flag) > 2:
+        matches = [option for option in (*_HELP_FLAGS[1:], *_OPTIONS) if option.startswith(flag)]
+        if len(matches) > 1:
+            _argument_error(f"ambiguous option: {flag} could match {', '.join(matches)}")
+        if matches:
+            return matches[0]
+    return None
+
+
+def parse_arguments():
+    """Parse command-line arguments.
     
-    parser.add_argument(
-        '--initial-program',
-        type=str,
-        required=True,
-        help='Path to the initial Python program with EVOLVE-BLOCK markers'
-    )
+    The CLI has four fixed flags, so they are parsed with a single walk over
+    sys.argv rather than building an argparse parser. As with argparse,
+    both "--flag value" and "--flag=value" forms are accepted, long flags may
+    be abbreviated to any unambiguous prefix, and -h/--help only count where
+    an option is expected (not as the value of another flag).
     
-    parser.add_argument(
-        '--evaluator',
-        type=str,
-        required=True,
-        help='Path to the evaluator module with evaluate() function'
-    )
+    Returns:
+        types.SimpleNamespace: Parsed arguments.
+    """
+    argv = sys.argv[1:]
     
-    parser.add_argument(
-        '--iterations',
-        type=int,
-        required=True,
-        help='Number of optimization iterations to run'
-    )
+    # No arguments at all: show help
+    if not argv:
+        print(_STATIC_HELP)
+        sys.exit(0)
     
-    parser.add_argument(
-        '--output-dir',
-        type=str,
-        default=None,
-        help='Directory for output files (default: creates timestamped directory)'
-    )
+    args = SimpleNamespace(**{dest: None for dest, _ in _OPTIONS.values()})
+    seen = set()
+    i = 0
+    
+    while i < len(argv):
+        arg = argv[i]
+        flag, sep, value = arg.partition('=') if arg.startswith('--') else (arg, '', '')
+        flag = _resolve_flag(flag) if _is_option(arg) else None
+        if flag is None:
+            _argument_error(f"unrecognized arguments: {arg}")
+        
+        if flag in _HELP_FLAGS:
+            if sep:
+                _argument_error(f"argument -h/--help: ignored explicit argument '{value}'")
+            print(_STATIC_HELP)
+            sys.exit(0)
+        
+        if not sep:
+            if i + 1 >= len(argv) or _is_option(argv[i + 1]):
+                _argument_error(f"argument {flag}: expected one argument")
+            i += 1
+            value = argv[i]
+        i += 1
+        
+        dest, value_type = _OPTIONS[flag]
+        try:
+            setattr(args, dest, value_type(value))
+        except ValueError:
+            _argument_error(
+                f"argument {flag}: invalid {value_type.__name__} value: '{value}'"
+            )
+        seen.add(flag)
+    
+    missing = [flag for flag in _REQUIRED_OPTIONS if flag not in seen]
+    if missing:
+        _argument_error(
+            f"the following arguments are required: {', '.join(missing)}"
+        )
     
-    return parser.parse_args()
+    return args
 
 
 def validate_file_exists(file_path: str, file_description: str) -> None:
@@ -182,39 +315,47 @@ def validate_file_exists(file_path: str, file_description: str) -> None:
     Raises:
         SystemExit: If the file doesn't exist or isn't readable.
     """
-    path = Path(file_path)
-    
-    if not path.exists():
+    # A single stat answers both existence and file type
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
         logger.error("%s not found: %s", file_description, file_path)
         sys.exit(1)
+    except OSError as e:
+        # e.g. a permission error or a path component that isn't a directory
+        logger.error("%s cannot be accessed: %s (%s)", file_description, file_path, e.strerror)
+        sys.exit(1)
     
-    if not path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         logger.error("%s is not a file: %s", file_description, file_path)
         sys.exit(1)
     
-    # Try to read the file to ensure it's readable
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            f.read(1)  # Read just one character to test readability
-    except (IOError, OSError, PermissionError) as e:
-        logger.error("%s is not readable: %s - %s", file_description, file_path, str(e))
+    if not os.access(file_path, os.R_OK):
+        logger.error("%s is not readable: %s", file_description, file_path)
         sys.exit(1)
     
     logger.debug("%s validated: %s", file_description, file_path)
 
 
-def validate_initial_program(program_path: str) -> None:
+def validate_initial_program(program_text: str) -> None:
     """Validate that the initial program has valid EVOLVE-BLOCK markers.
     
     Args:
-        program_path: Path to the program file.
+        program_text: Contents of the program file.
         
     Raises:
         SystemExit: If the program doesn't have valid EVOLVE-BLOCKs.
     """
-    program_manager = ProgramManager()
+    from code_optimization.core.program_manager import ProgramManager
 
-    if not program_manager.validate_program(program_path):
+    # Validate and parse the markers in one pass over the text
+    try:
+        blocks = ProgramManager().extract_evolve_blocks_from_text(program_text)
+    except ValueError as e:
+        logger.error("Error parsing EVOLVE-BLOCKs: %s", str(e))
+        sys.exit(1)
+
+    if not blocks:
         logger.error(
             "Initial program does not contain valid EVOLVE-BLOCK markers.\n"
             "Programs must have at least one pair of markers:\n"
@@ -224,13 +365,7 @@ def validate_initial_program(program_path: str) -> None:
         )
         sys.exit(1)
 
-    # Count the blocks for informational purposes
-    try:
-        blocks = program_manager.extract_evolve_blocks(program_path)
-        logger.info("Found %d EVOLVE-BLOCK(s) in initial program", len(blocks))
-    except Exception as e:
-        logger.error("Error parsing EVOLVE-BLOCKs: %s", str(e))
-        sys.exit(1)
+    logger.info("Found %d EVOLVE-BLOCK(s) in initial program", len(blocks))
 
 
 def create_default_output_dir(initial_program_path: str) -> str:
@@ -243,26 +378,41 @@ def create_default_output_dir(initial_program_path: str) -> str:
         Path to the created output directory.
     """
     timestamp = time.strftime("%Y%m%d_%H%M%S")
-    program_dir = Path(initial_program_path).parent
-    output_dir = str(program_dir / f"optimization_output_{timestamp}")
+    program_dir = os.path.dirname(initial_program_path) or "."
+    output_dir = os.path.join(program_dir, f"optimization_output_{timestamp}")
     logger.info("Using default output directory: %s", output_dir)
     return output_dir
 
 
 def main():
     """Main entry point for the optimization system."""
-    # Parse arguments
+    # Parse arguments (help is printed before logging is set up)
     args = parse_arguments()
 
+    configure_logging()
+
+    # Imported after parsing so --help and argument errors don't pay for
+    # loading strands and the agent stack
+    from code_optimization.orchestrator import OptimizationOrchestrator
+
     logger.info("Starting Program Optimization")
-    logger.info("=" * 60)
+    logger.info(_BANNER)
 
     # Validate inputs
     logger.info("Validating inputs...")
 
     validate_file_exists(args.initial_program, "Initial program")
     validate_file_exists(args.evaluator, "Evaluator")
-    validate_initial_program(args.initial_program)
+
+    # Read the initial program once; validation works on the text
+    try:
+        with open(args.initial_program, 'r', encoding='utf-8') as f:
+            program_text = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        logger.error("Initial program is not readable: %s - %s", args.initial_program, str(e))
+        sys.exit(1)
+
+    validate_initial_program(program_text)
 
     # Create output directory if not provided
     output_dir = args.output_dir
@@ -270,7 +420,7 @@ def main():
         output_dir = create_default_output_dir(args.initial_program)
 
     logger.info("All inputs validated successfully")
-    logger.info("=" * 60)
+    logger.info(_BANNER)
 
     # Initialize and run the orchestrator
     try:
@@ -283,7 +433,7 @@ def main():
         )
 
         logger.info("Starting optimization process...")
-        logger.info("=" * 60)
+        logger.info(_BANNER)
 
         orchestrator.run()
 
@@ -1,7 +1,17 @@
-"""Agent components for the optimization system."""
+"""Agent components for the optimization system.
 
-from .researcher_agent import create_researcher_agent, RESEARCHER_SYSTEM_PROMPT
-from .supervisor_agent import create_supervisor_agent, SUPERVISOR_SYSTEM_PROMPT
+Exports are resolved lazily (PEP 562) so that importing one agent does not
+load the other agent's module.
+"""
+
+import importlib
+
+_LAZY_EXPORTS = {
+    "create_researcher_agent": ".researcher_agent",
+    "RESEARCHER_SYSTEM_PROMPT": ".researcher_agent",
+    "create_supervisor_agent": ".supervisor_agent",
+    "SUPERVISOR_SYSTEM_PROMPT": ".supervisor_agent",
+}
 
 __all__ = [
     "create_researcher_agent",
@@ -9,3 +19,18 @@ __all__ = [
     "create_supervisor_agent",
     "SUPERVISOR_SYSTEM_PROMPT",
 ]
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,49 @@
+"""Model construction shared by the optimization agents.
+
+Both agents normally run on the same provider and model ID, so model
+instances are cached and shared instead of setting up a second provider
+client (credential resolution, HTTP session, etc.) for the second agent.
+"""
+
+import functools
+import os
+
+
+def get_model(model_id: str = None):
+    """Return the model for the configured provider, shared across agents.
+
+    Args:
+        model_id: The model ID to use. If None, uses MODEL_ID environment variable
+            or the provider's default model.
+
+    Returns:
+        A strands model instance (BedrockModel or GeminiModel), selected by the
+        MODEL_PROVIDER environment variable (default: bedrock).
+    """
+    # Determine model type from environment variable (default: bedrock)
+    model_type = os.getenv("MODEL_PROVIDER", "bedrock").lower()
+
+    # Determine model ID
+    if model_id is None:
+        model_id = os.getenv("MODEL_ID")
+        if model_id is None:
+            # Set default based on model type
+            if model_type == "gemini":
+                model_id = "gemini-2.5-flash"
+            else:
+                model_id = "global.anthropic.claude-sonnet-4-5-20250929-v1:0"
+
+    return _create_model(model_type, model_id)
+
+
+@functools.lru_cache(maxsize=4)
+def _create_model(model_type: str, model_id: str):
+    """Create the appropriate model based on type (cached per type and ID)."""
+    if model_type == "gemini":
+        from strands.models.gemini import GeminiModel
+
+        return GeminiModel(model_id=model_id)
+
+    from strands.models import BedrockModel
+
+    return BedrockModel(model_id=model_id)
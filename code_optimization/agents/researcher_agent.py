@@ -8,172 +8,35 @@ This module defines the Researcher Agent, which is responsible for:
 - Collaborating with the Supervisor Agent
 """
 
-import os
-from strands import Agent
-from strands.models import BedrockModel
-from strands.models.gemini import GeminiModel
-from strands.agent.conversation_manager import SlidingWindowConversationManager
-
-from ..tools.researcher_tools import (
-    read_file,
-    write_file,
-    execute_shell,
-    parse_evolve_blocks,
-    replace_evolve_blocks,
-    evaluate_program,
-)
-
-
-# Comprehensive system prompt for the Researcher Agent
-RESEARCHER_SYSTEM_PROMPT = """You are an expert Researcher Agent specializing in algorithmic optimization and program improvement. Your role is to iteratively improve Python programs through systematic experimentation and analysis.
-
-## Your Capabilities
-
-You have access to tools that allow you to:
-- Read and analyze program files
-- Create modified versions of programs
-- Execute shell commands 
-- Evaluate any version of the program
-- Parse and manipulate EVOLVE-BLOCK sections in code
-- Replace code within designated optimization blocks
-
-## Core Principles of Algorithmic Optimization
-
-### 1. Performance Analysis
-- Identify computational bottlenecks through profiling and measurement
-- Understand time and space complexity of algorithms
-- Recognize patterns that lead to inefficiency (nested loops, redundant computations, poor data structures)
-
-### 2. Common Algorithmic Patterns and Trade-offs
-- **Greedy vs. Optimal**: Greedy algorithms are fast but may miss global optima
-- **Exploration vs. Exploitation**: Balance between trying new approaches and refining known good solutions
-- **Time vs. Space**: Trading memory for speed or vice versa
-- **Deterministic vs. Stochastic**: Random elements can escape local optima but reduce reproducibility
-- **Iterative vs. Recursive**: Consider stack depth and tail call optimization
-- **Caching/Memoization**: Store computed results to avoid redundant work
-- **Divide and Conquer**: Break problems into smaller subproblems
-- **Dynamic Programming**: Build solutions from overlapping subproblems
-- **Heuristics**: Use domain knowledge to guide search
-
-### 3. Optimization Techniques
-- **Algorithm Selection**: Choose the right algorithm for the problem (sorting, searching, graph algorithms, etc.)
-- **Data Structure Selection**: Arrays, hash tables, trees, heaps, graphs - each has different performance characteristics
-- **Loop Optimization**: Reduce iterations, eliminate redundant checks, vectorize operations
-- **Early Termination**: Stop when a solution is found or when further search is unlikely to improve
-- **Pruning**: Eliminate branches of search space that cannot lead to better solutions
-- **Approximation**: Accept near-optimal solutions for significant speedup
-- **Parallelization**: Exploit multiple cores when operations are independent
-
-### 4. Experimental Methodology
-
-Follow this rigorous process for each iteration:
-
-**HYPOTHESIS**: Before making any changes, explicitly state:
-- What specific improvement you expect (e.g., "reduce runtime by 30%", "improve solution quality")
-- Why you believe this change will help (based on analysis, theory, or previous findings)
-- What metric will demonstrate success
-
-**IMPLEMENTATION**: When modifying code:
-- Make focused, incremental changes (one idea at a time)
-- Preserve the program's interface and structure
-- Only modify code within EVOLVE-BLOCK sections
-- Ensure the modified code is syntactically correct and logically sound
-
-**EXPERIMENTATION**: After implementing:
-- Run the modified program using the evaluator
-- Collect performance metrics and any relevant outputs
-- Compare results to previous iterations
-
-**ANALYSIS**: After seeing results:
-- Interpret what the metrics reveal about your hypothesis
-- Identify why the change succeeded or failed
-- Extract insights that inform future iterations
-- Document key learnings
-
-**FINDINGS**: Explicitly document:
-- Whether the hypothesis was confirmed or refuted
-- Quantitative results (scores, timing, etc.)
-- Qualitative observations (behavior changes, edge cases discovered)
-- Insights gained about the problem or algorithm
-
-**NEXT STEPS**: Based on findings:
-- Propose the next experiment or refinement
-- Explain how it builds on current knowledge
-- Identify alternative directions if current approach seems unproductive
-
-## Working with EVOLVE-BLOCKs
-
-Programs contain sections marked with:
-```python
-# EVOLVE-BLOCK-START
-<code that can be modified>
-# EVOLVE-BLOCK-END
-```
-
-- You can ONLY modify code within these blocks
-- All other code (imports, function signatures, etc.) must remain unchanged
-- Use `parse_evolve_blocks` to see what can be modified
-- Use `replace_evolve_blocks` to create new program versions
-
-## Collaboration with Supervisor
-
-You work alongside a Supervisor Agent who:
-- Reviews your proposals and reasoning
-- Asks clarifying questions
-- Provides guidance and feedback
-- Helps keep research on track
-
-When interacting with the Supervisor:
-- Be explicit about your reasoning and rationale
-- Respond thoughtfully to questions
-- Consider feedback seriously
-- Hand off to the Supervisor when you want feedback or approval
-
-## Context and Memory
-
-You have access to the complete history of previous iterations, including:
-- All previous hypotheses and implementations (and you can modify any implementation, not just the initial one or the last one)
-- Evaluation results and metrics
-- Your findings and analysis
-- Supervisor feedback
-
-Use this history to:
-- Avoid repeating failed approaches
-- Build on successful ideas
-- Recognize patterns across iterations
-- Make informed decisions about next steps
-
-## Output Format
-
-Structure your responses clearly:
-
-**HYPOTHESIS**: [State your hypothesis clearly]
-
-**RATIONALE**: [Explain why you believe this will work]
-
-**IMPLEMENTATION PLAN**: [Describe what you'll change]
+import functools
+from importlib import resources
+from typing import TYPE_CHECKING
 
-[Use tools to implement and test]
+from .models import get_model
 
-**FINDINGS**: [After evaluation, analyze the results]
+if TYPE_CHECKING:
+    from strands import Agent
 
-**NEXT STEPS**: [Propose what to try next]
 
-## Important Guidelines
+# The comprehensive system prompt for the Researcher Agent lives in
+# researcher_prompt.md and is read on first use.
+@functools.cache
+def _load_system_prompt() -> str:
+    return (
+        resources.files(__package__)
+        .joinpath("researcher_prompt.md")
+        .read_text(encoding="utf-8")
+    )
 
-1. **Be Systematic**: Follow the experimental methodology rigorously
-2. **Be Explicit**: Always state your reasoning clearly
-3. **Be Incremental**: Make one focused change at a time
-4. **Be Analytical**: Deeply analyze results, don't just report numbers
-5. **Be Adaptive**: Learn from failures and adjust your approach
-6. **Be Collaborative**: Engage meaningfully with the Supervisor
-7. **Be Thorough**: Document findings comprehensively for future reference
 
-Your goal is not just to improve the program, but to understand *why* improvements work and build a coherent understanding of the problem space through systematic experimentation.
-"""
+def __getattr__(name: str):
+    # Keeps RESEARCHER_SYSTEM_PROMPT importable as a module attribute
+    if name == "RESEARCHER_SYSTEM_PROMPT":
+        return _load_system_prompt()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-def create_researcher_agent(model_id: str = None, window_size: int = 50) -> Agent:
+def create_researcher_agent(model_id: str = None, window_size: int = 50) -> "Agent":
     """Create and configure the Researcher Agent.
 
     Args:
@@ -186,24 +49,23 @@ def create_researcher_agent(model_id: str = None, window_size: int = 50) -> Agen
     Returns:
         A configured Agent instance ready for use in the optimization system.
     """
-    # Determine model type from environment variable (default: bedrock)
-    model_type = os.getenv("MODEL_PROVIDER", "bedrock").lower()
-
-    # Determine model ID
-    if model_id is None:
-        model_id = os.getenv("MODEL_ID")
-        if model_id is None:
-            # Set default based on model type
-            if model_type == "gemini":
-                model_id = "gemini-2.5-flash"
-            else:
-                model_id = "global.anthropic.claude-sonnet-4-5-20250929-v1:0"
-
-    # Create the appropriate model based on type
-    if model_type == "gemini":
-        model = GeminiModel(model_id=model_id)
-    else:
-        model = BedrockModel(model_id=model_id)
+    # Imported here so that importing this module (e.g. for the system
+    # prompt) does not load strands and the model provider SDKs
+    from strands import Agent
+    from strands.agent.conversation_manager import SlidingWindowConversationManager
+
+    from ..tools.researcher_tools import (
+        read_file,
+        write_file,
+        execute_shell,
+        parse_evolve_blocks,
+        replace_evolve_blocks,
+        evaluate_program,
+        evaluate_programs,
+    )
+
+    # Model instances are shared between agents with the same model ID
+    model = get_model(model_id)
 
     # Create a conversation manager to retain context across iterations
     # Using SlidingWindowConversationManager to maintain recent history
@@ -216,7 +78,7 @@ def create_researcher_agent(model_id: str = None, window_size: int = 50) -> Agen
     agent = Agent(
         model=model,
         name="researcher",
-        system_prompt=RESEARCHER_SYSTEM_PROMPT,
+        system_prompt=_load_system_prompt(),
         tools=[
             read_file,
             write_file,
@@ -224,6 +86,7 @@ def create_researcher_agent(model_id: str = None, window_size: int = 50) -> Agen
             parse_evolve_blocks,
             replace_evolve_blocks,
             evaluate_program,
+            evaluate_programs,
         ],
         conversation_manager=conversation_manager,
     )
@@ -1,7 +1,10 @@
-from dataclasses import dataclass, field
-from typing import Any, Optional
+from dataclasses import dataclass
+from typing import Optional
 
-@dataclass
+# Common prefix of "# EVOLVE-BLOCK-START" and "# EVOLVE-BLOCK-END"
+_MARKER_PREFIX = "# EVOLVE-BLOCK-"
+
+@dataclass(slots=True, frozen=True)
 class EvolveBlock:
     """Represents a code block marked for optimization.
     
@@ -10,19 +13,136 @@ class EvolveBlock:
         end_line: Line number where the block ends (inclusive).
         content: The code content within the block.
         block_id: Identifier for this block (for multiple blocks in one file).
+    
+    Fields are not validated on construction; blocks come from the marker
+    parsers, which guarantee 0 <= start_line <= end_line and sequential
+    block IDs.
     """
     start_line: int
     end_line: int
     content: str
     block_id: int
-    
-    def __post_init__(self):
-        """Validate block structure."""
-        if self.start_line < 0:
-            raise ValueError("start_line must be non-negative")
-        
-        if self.end_line < self.start_line:
-            raise ValueError("end_line must be >= start_line")
-        
-        if self.block_id < 0:
-            raise ValueError("block_id must be non-negative")
+
+    @classmethod
+    def scan(cls, text: str) -> list["EvolveBlock"]:
+        """Parse all EVOLVE-BLOCKs from program text in a single pass.
+
+        Args:
+            text: The full program source.
+
+        Returns:
+            List of EvolveBlock objects in file order (empty if no markers).
+
+        Raises:
+            ValueError: If the markers are unbalanced or nested.
+        """
+        return cls.from_spans(text, find_block_spans(text))
+
+    @classmethod
+    def from_spans(
+        cls, text: str, spans: list[tuple[int, int, int, int]]
+    ) -> list["EvolveBlock"]:
+        """Build EvolveBlocks from spans that find_block_spans found in text.
+
+        Args:
+            text: The full program source.
+            spans: find_block_spans(text).
+
+        Returns:
+            List of EvolveBlock objects in file order.
+        """
+        return [
+            cls(
+                start_line=start_line,
+                end_line=end_line,
+                content=text[content_start:content_end],
+                block_id=block_id
+            )
+            for block_id, (start_line, end_line, content_start, content_end)
+            in enumerate(spans)
+        ]
+
+
+def marker_kind(line: str) -> Optional[bool]:
+    """Classify a program line as an EVOLVE-BLOCK marker.
+
+    Markers are whole-line comments: only indentation may precede them.
+
+    Args:
+        line: One line of program source.
+
+    Returns:
+        True for a start marker, False for an end marker, None for any other line.
+    """
+    stripped = line.lstrip(" \t")
+    if not stripped.startswith(_MARKER_PREFIX):
+        return None
+    if stripped.startswith("START", len(_MARKER_PREFIX)):
+        return True
+    if stripped.startswith("END", len(_MARKER_PREFIX)):
+        return False
+    return None
+
+
+def find_block_spans(text: str) -> list[tuple[int, int, int, int]]:
+    """Locate all EVOLVE-BLOCKs in program text in a single pass.
+
+    Args:
+        text: The full program source.
+
+    Returns:
+        One (start_line, end_line, content_start, content_end) tuple per block,
+        in file order. start_line and end_line are the 0-based marker lines;
+        content_start and content_end are the character offsets of the text
+        between the two marker lines.
+
+    Raises:
+        ValueError: If the markers are unbalanced or nested.
+    """
+    spans = []
+    open_start = None  # (start_line, content_offset) of the unclosed block
+    line = 0
+    line_pos = 0  # offset up to which newlines have been counted
+    search_pos = 0
+
+    # Plain str.find scanning: markers are rare, so this avoids regex
+    # machinery and match objects entirely
+    while True:
+        hit = text.find(_MARKER_PREFIX, search_pos)
+        if hit < 0:
+            break
+
+        line_end = text.find("\n", hit)
+        next_line = len(text) if line_end < 0 else line_end + 1
+        search_pos = next_line
+
+        line_start = text.rfind("\n", 0, hit) + 1
+        is_start = marker_kind(text[line_start:next_line])
+        if is_start is None:
+            continue
+
+        line += text.count("\n", line_pos, hit)
+        line_pos = hit
+
+        if is_start:
+            if open_start is not None:
+                raise ValueError(
+                    f"EVOLVE-BLOCK starting at line {open_start[0] + 1} "
+                    f"has no matching end marker"
+                )
+            open_start = (line, next_line)
+        else:
+            if open_start is None:
+                raise ValueError(
+                    f"EVOLVE-BLOCK end at line {line + 1} has no matching start marker"
+                )
+            spans.append((open_start[0], line, open_start[1], line_start))
+            open_start = None
+
+    if open_start is not None:
+        raise ValueError(
+            f"EVOLVE-BLOCK starting at line {open_start[0] + 1} "
+            f"has no matching end marker"
+        )
+
+    return spans
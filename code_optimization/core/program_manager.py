@@ -1,14 +1,43 @@
 """Program Manager for code manipulation and EVOLVE-BLOCK handling."""
 
 import logging
-import re
+import os
+import shutil
+import tempfile
 from pathlib import Path
-from typing import Optional
 
-from .evolve_block import EvolveBlock
+from .evolve_block import EvolveBlock, find_block_spans, marker_kind
+
+# Parse-cache key: (path, inode, mtime_ns, size)
+_CacheKey = tuple[str, int, int, int]
 
 logger = logging.getLogger(__name__)
 
+# Buffer size for streaming program reads (the default is 8 KiB)
+_READ_BUFFER_SIZE = 1 << 18
+
+
+def _read_umask() -> int:
+    """Return the process umask, preferably without changing it."""
+    try:
+        with open('/proc/self/status', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('Umask:'):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+    # No procfs: os.umask can only be read by setting it, which is safe here
+    # because this runs once, at import
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+# Mode open() gives a new file, used for programs written to a new path.
+# Computed once: the umask is process-wide, so reading it later could race
+# with files being created on other threads
+_NEW_FILE_MODE = 0o666 & ~_read_umask()
+
 
 class ProgramManager:
     """Manages program files and EVOLVE-BLOCK operations.
@@ -24,6 +53,16 @@ class ProgramManager:
     BLOCK_START_MARKER = "# EVOLVE-BLOCK-START"
     BLOCK_END_MARKER = "# EVOLVE-BLOCK-END"
     
+    def __init__(self):
+        # Block spans and parsed blocks per path, tagged with the key they
+        # were parsed under, so unchanged files are only parsed once across
+        # extract/replace calls and a rewritten file replaces its stale entry
+        # instead of adding another
+        self._parse_cache: dict[
+            str,
+            tuple[_CacheKey, list[tuple[int, int, int, int]], list[EvolveBlock]]
+        ] = {}
+    
     def validate_program(self, program_path: str) -> bool:
         """Check if program has valid EVOLVE-BLOCK markers.
         
@@ -37,53 +76,94 @@ class ProgramManager:
         logger.debug("Validating program: %s", program_path)
         
         try:
-            with open(program_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            block_count = 0
+            open_line = None  # 0-based line of the unclosed start marker
             
-            logger.debug("Read program file: %d characters", len(content))
+            # Stream the file so only one line is held in memory at a time,
+            # stopping at the first unbalanced or nested marker. Lines are
+            # classified by the same rule find_block_spans uses
+            with open(program_path, 'r', encoding='utf-8', buffering=_READ_BUFFER_SIZE) as f:
+                for line_num, line in enumerate(f):
+                    is_start = marker_kind(line)
+                    if is_start is None:
+                        continue
+                    
+                    if is_start:
+                        if open_line is not None:
+                            logger.debug(
+                                "Validation failed: EVOLVE-BLOCK starting at line %d "
+                                "has no matching end marker", open_line + 1
+                            )
+                            return False
+                        open_line = line_num
+                    else:
+                        if open_line is None:
+                            logger.debug(
+                                "Validation failed: EVOLVE-BLOCK end at line %d "
+                                "has no matching start marker", line_num + 1
+                            )
+                            return False
+                        open_line = None
+                        block_count += 1
             
-            # Count start and end markers
-            start_count = content.count(self.BLOCK_START_MARKER)
-            end_count = content.count(self.BLOCK_END_MARKER)
-            
-            logger.debug("Found %d start markers and %d end markers", start_count, end_count)
-            
-            # Must have at least one pair and equal counts
-            if start_count == 0 or end_count == 0:
-                logger.debug("Validation failed: no EVOLVE-BLOCK markers found")
+            if open_line is not None:
+                logger.debug(
+                    "Validation failed: EVOLVE-BLOCK starting at line %d "
+                    "has no matching end marker", open_line + 1
+                )
                 return False
             
-            if start_count != end_count:
-                logger.debug("Validation failed: mismatched marker counts")
+            # Must have at least one pair
+            if not block_count:
+                logger.debug("Validation failed: no EVOLVE-BLOCK markers found")
                 return False
             
-            # Verify proper nesting (start before end for each pair)
-            lines = content.split('\n')
-            stack = []
-            
-            for line in lines:
-                if self.BLOCK_START_MARKER in line:
-                    stack.append('start')
-                elif self.BLOCK_END_MARKER in line:
-                    if not stack or stack[-1] != 'start':
-                        logger.debug("Validation failed: improper nesting detected")
-                        return False
-                    stack.pop()
-            
-            # All blocks should be closed
-            is_valid = len(stack) == 0
-            
-            if is_valid:
-                logger.debug("Program validation successful: %d valid EVOLVE-BLOCK(s)", start_count)
-            else:
-                logger.debug("Validation failed: unclosed EVOLVE-BLOCK(s)")
-            
-            return is_valid
+            logger.debug("Program validation successful: %d valid EVOLVE-BLOCK(s)", block_count)
+            return True
             
         except (IOError, OSError) as e:
             logger.error("Failed to read program file %s: %s", program_path, str(e))
             return False
     
+    def extract_evolve_blocks_from_text(self, content: str) -> list[EvolveBlock]:
+        """Parse and validate EVOLVE-BLOCKs from program text already in memory.
+        
+        Args:
+            content: The program source.
+            
+        Returns:
+            List of EvolveBlock objects, empty if the program has no markers.
+            
+        Raises:
+            ValueError: If the program has invalid EVOLVE-BLOCK structure.
+        """
+        return EvolveBlock.scan(content)
+    
+    def _cache_key(self, program_path: str, st: os.stat_result) -> _CacheKey:
+        """Build the parse-cache key for a program file from its stat result."""
+        return (program_path, st.st_ino, st.st_mtime_ns, st.st_size)
+    
+    def _parse_and_cache(
+        self,
+        program_path: str,
+        content: str,
+        cache_key: _CacheKey
+    ) -> tuple[list[tuple[int, int, int, int]], list[EvolveBlock]]:
+        """Parse program content and remember the result under cache_key.
+        
+        Returns:
+            The block spans (see find_block_spans) and the blocks.
+        """
+        try:
+            spans = find_block_spans(content)
+        except ValueError as e:
+            logger.error("Invalid EVOLVE-BLOCK structure in %s: %s", program_path, str(e))
+            raise
+        
+        blocks = EvolveBlock.from_spans(content, spans)
+        self._parse_cache[program_path] = (cache_key, spans, blocks)
+        return spans, blocks
+    
     def extract_evolve_blocks(self, program_path: str) -> list[EvolveBlock]:
         """Extract all EVOLVE-BLOCK sections from a program.
         
@@ -99,63 +179,26 @@ class ProgramManager:
         """
         logger.debug("Extracting EVOLVE-BLOCKs from: %s", program_path)
         
-        path = Path(program_path)
-        if not path.exists():
+        try:
+            f = open(program_path, 'r', encoding='utf-8')
+        except FileNotFoundError:
             logger.error("Program file not found: %s", program_path)
-            raise FileNotFoundError(f"Program file not found: {program_path}")
-        
-        with open(program_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        logger.debug("Read %d lines from program file", len(lines))
+            raise FileNotFoundError(f"Program file not found: {program_path}") from None
         
-        blocks = []
-        block_id = 0
-        i = 0
-        
-        while i < len(lines):
-            line = lines[i]
+        with f:
+            # Stat the open file, so the key describes the file that is read
+            cache_key = self._cache_key(program_path, os.fstat(f.fileno()))
+            cached = self._parse_cache.get(program_path)
             
-            if self.BLOCK_START_MARKER in line:
-                start_line = i
-                logger.debug("Found EVOLVE-BLOCK start at line %d", start_line + 1)
-                
-                # Find the corresponding end marker
-                end_line = None
-                
-                for j in range(i + 1, len(lines)):
-                    if self.BLOCK_END_MARKER in lines[j]:
-                        end_line = j
-                        break
-                
-                if end_line is None:
-                    logger.error("EVOLVE-BLOCK at line %d has no matching end marker", start_line + 1)
-                    raise ValueError(
-                        f"EVOLVE-BLOCK starting at line {start_line + 1} "
-                        f"has no matching end marker"
-                    )
-                
-                logger.debug("Found EVOLVE-BLOCK end at line %d", end_line + 1)
-                
-                # Extract content between markers (excluding the marker lines)
-                content_lines = lines[start_line + 1:end_line]
-                content = ''.join(content_lines)
-                
-                logger.debug("Extracted block %d: %d lines, %d characters", 
-                           block_id, len(content_lines), len(content))
-                
-                blocks.append(EvolveBlock(
-                    start_line=start_line,
-                    end_line=end_line,
-                    content=content,
-                    block_id=block_id
-                ))
-                
-                block_id += 1
-                i = end_line + 1
+            if cached is None or cached[0] != cache_key:
+                content = f.read()
+                logger.debug("Read %d characters from program file", len(content))
+                _, blocks = self._parse_and_cache(program_path, content, cache_key)
             else:
-                i += 1
+                logger.debug("Using cached EVOLVE-BLOCKs for %s", program_path)
+                blocks = cached[2]
         
+        blocks = list(blocks)
         logger.info("Extracted %d EVOLVE-BLOCK(s) from %s", len(blocks), program_path)
         return blocks
     
@@ -163,7 +206,9 @@ class ProgramManager:
         self,
         program_path: str,
         blocks: list[EvolveBlock],
-        output_path: str
+        output_path: str,
+        *,
+        validate: bool = True
     ) -> None:
         """Replace EVOLVE-BLOCK content and save to output_path.
         
@@ -174,6 +219,10 @@ class ProgramManager:
             program_path: Path to the original program file.
             blocks: List of EvolveBlock objects with new content.
             output_path: Path where the modified program should be saved.
+            validate: Check that the block IDs are exactly 0..n-1. Pass False
+                only when the caller has already checked that the IDs are
+                unique and exist in the program. The block count is always
+                checked.
             
         Raises:
             FileNotFoundError: If program_path doesn't exist.
@@ -181,24 +230,33 @@ class ProgramManager:
         """
         logger.debug("Replacing EVOLVE-BLOCKs in %s with %d new blocks", program_path, len(blocks))
         
-        path = Path(program_path)
-        if not path.exists():
+        # Read the program once as a single string
+        try:
+            with open(program_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+                cache_key = self._cache_key(program_path, os.fstat(f.fileno()))
+        except FileNotFoundError:
             logger.error("Program file not found: %s", program_path)
-            raise FileNotFoundError(f"Program file not found: {program_path}")
-        
-        with open(program_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        logger.debug("Read %d lines from original program", len(lines))
-        
-        # Extract current blocks to validate structure
-        current_blocks = self.extract_evolve_blocks(program_path)
-        
-        if len(blocks) != len(current_blocks):
+            raise FileNotFoundError(f"Program file not found: {program_path}") from None
+        
+        logger.debug("Read %d characters from original program", len(content))
+        
+        # Locate the current blocks to validate structure, reusing the parse
+        # from an earlier extract_evolve_blocks call when the file is
+        # unchanged; the character offsets let the output be assembled from
+        # slices of content
+        cached = self._parse_cache.get(program_path)
+        if cached is not None and cached[0] == cache_key:
+            logger.debug("Using cached EVOLVE-BLOCK spans for %s", program_path)
+            current_spans = cached[1]
+        else:
+            current_spans, _ = self._parse_and_cache(program_path, content, cache_key)
+        
+        if len(blocks) != len(current_spans):
             logger.error("Block count mismatch: expected %d, got %d", 
-                        len(current_blocks), len(blocks))
+                        len(current_spans), len(blocks))
             raise ValueError(
-                f"Number of blocks mismatch: expected {len(current_blocks)}, "
+                f"Number of blocks mismatch: expected {len(current_spans)}, "
                 f"got {len(blocks)}"
             )
         
@@ -206,65 +264,46 @@ class ProgramManager:
         sorted_blocks = sorted(blocks, key=lambda b: b.block_id)
         logger.debug("Sorted %d blocks by block_id", len(sorted_blocks))
         
-        # Validate block_ids match
-        for new_block, current_block in zip(sorted_blocks, current_blocks):
-            if new_block.block_id != current_block.block_id:
-                logger.error("Block ID mismatch: expected %d, got %d",
-                           current_block.block_id, new_block.block_id)
-                raise ValueError(
-                    f"Block ID mismatch: expected {current_block.block_id}, "
-                    f"got {new_block.block_id}"
-                )
-        
-        logger.debug("Block IDs validated successfully")
+        # Validate block_ids match (current blocks are numbered in file order)
+        if validate:
+            for expected_id, new_block in enumerate(sorted_blocks):
+                if new_block.block_id != expected_id:
+                    logger.error("Block ID mismatch: expected %d, got %d",
+                               expected_id, new_block.block_id)
+                    raise ValueError(
+                        f"Block ID mismatch: expected {expected_id}, "
+                        f"got {new_block.block_id}"
+                    )
+            
+            logger.debug("Block IDs validated successfully")
         
-        # Build the new program by replacing block contents
-        new_lines = []
-        block_idx = 0
-        i = 0
+        # Build the new program: the text up to and including each start
+        # marker line, the new block content, then continue from the end
+        # marker line
+        new_parts = []
+        cursor = 0
         
-        while i < len(lines):
-            line = lines[i]
+        for new_block, (_, _, content_start, content_end) in zip(sorted_blocks, current_spans):
+            new_parts.append(content[cursor:content_start])
             
-            if self.BLOCK_START_MARKER in line:
-                # Keep the start marker
-                new_lines.append(line)
-                
-                # Find the end marker
-                end_line = None
-                for j in range(i + 1, len(lines)):
-                    if self.BLOCK_END_MARKER in lines[j]:
-                        end_line = j
-                        break
-                
-                if end_line is None:
-                    logger.error("EVOLVE-BLOCK at line %d has no matching end marker", i + 1)
-                    raise ValueError(
-                        f"EVOLVE-BLOCK starting at line {i + 1} "
-                        f"has no matching end marker"
-                    )
-                
-                # Insert the new content
-                new_content = sorted_blocks[block_idx].content
-                logger.debug("Replacing block %d with %d characters of new content",
-                           block_idx, len(new_content))
-                
-                # Ensure content ends with newline if it doesn't already
-                if new_content and not new_content.endswith('\n'):
-                    new_content += '\n'
-                new_lines.append(new_content)
-                
-                # Keep the end marker
-                new_lines.append(lines[end_line])
-                
-                block_idx += 1
-                i = end_line + 1
-            else:
-                # Keep all other lines unchanged
-                new_lines.append(line)
-                i += 1
+            # Insert the new content
+            new_content = new_block.content
+            logger.debug("Replacing block %d with %d characters of new content",
+                       new_block.block_id, len(new_content))
+            
+            # Ensure content ends with newline if it doesn't already
+            if new_content and not new_content.endswith('\n'):
+                new_content += '\n'
+            new_parts.append(new_content)
+            
+            cursor = content_end
+        
+        # Keep everything after the last block unchanged
+        new_parts.append(content[cursor:])
         
-        logger.debug("Built new program with %d lines", len(new_lines))
+        new_program = ''.join(new_parts)
+        logger.debug("Built new program: %d characters from %d parts",
+                    len(new_program), len(new_parts))
         
         # Write the modified program
         output_path_obj = Path(output_path)
@@ -272,12 +311,37 @@ class ProgramManager:
         
         logger.debug("Writing modified program to: %s", output_path)
         
+        # Write a uniquely named temporary file next to the target and rename
+        # it over the target, so readers never see a partially written
+        # program. Symlinks are resolved so that the file they point to is
+        # replaced rather than the link itself.
+        target = Path(os.path.realpath(output_path_obj))
+        tmp_path = None
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.writelines(new_lines)
+            with tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', dir=target.parent,
+                prefix=f".{target.name}.", suffix='.tmp', delete=False
+            ) as f:
+                tmp_path = f.name
+                f.write(new_program)
+            
+            # Give the temporary file (created 0600) the mode of the file it
+            # replaces, or the usual mode for a new file
+            try:
+                shutil.copymode(target, tmp_path)
+            except FileNotFoundError:
+                os.chmod(tmp_path, _NEW_FILE_MODE)
+            
+            os.replace(tmp_path, target)
+            # A rewrite within one mtime tick can keep the old size and mtime
+            # (and reuse the old inode), so drop any parse of the old file
+            self._parse_cache.pop(output_path, None)
+            self._parse_cache.pop(str(target), None)
             logger.info("Successfully wrote modified program to: %s", output_path)
         except IOError as e:
             logger.error("Failed to write modified program to %s: %s", output_path, str(e))
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
             raise
     
     def create_version(
@@ -314,7 +378,6 @@ class ProgramManager:
         logger.debug("Output directory ready: %s", output_dir_path)
         
         # Generate versioned filename
-        base_name = Path(base_program).stem
         extension = Path(base_program).suffix
         versioned_filename = f"iteration_{iteration_num:03d}{extension}"
         output_path = output_dir_path / versioned_filename
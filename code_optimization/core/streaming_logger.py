@@ -1,19 +1,118 @@
 """Streaming logger for real-time conversation logging."""
 
-import json
 import logging
+import queue
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, TextIO
 
 logger = logging.getLogger(__name__)
 
+# Queue sentinel telling the writer thread to flush and exit
+_STOP = object()
+
+
+def _bounded_str(value: Any, limit: int) -> str:
+    """Return str(value), or just enough of its start to exceed limit characters.
+    
+    Lists, tuples and dicts (the shapes tool inputs come in) are rendered
+    element by element, and rendering stops once the text is longer than
+    limit, so a large value is never converted to text in full. Long strings
+    and bytes inside them are cut before repr() (which may then pick other
+    quotes than repr() of the whole value would). Other values use str().
+    """
+    parts: list[str] = []
+    size = 0
+    active: set[int] = set()  # ids of the containers being rendered
+    
+    def emit(text: str) -> bool:
+        """Add text to the output; True once the output is over the limit."""
+        nonlocal size
+        parts.append(text)
+        size += len(text)
+        return size > limit
+    
+    def render(item: Any) -> bool:
+        """Add repr(item) to the output, stopping early at the limit."""
+        kind = type(item)
+        if kind in (list, tuple, dict):
+            # A container inside itself is shown as [...] etc., as repr() does
+            if id(item) in active:
+                return emit('[...]' if kind is list else '(...)' if kind is tuple else '{...}')
+            active.add(id(item))
+            try:
+                return render_container(item, kind)
+            finally:
+                active.discard(id(item))
+        if (kind is str or kind is bytes) and len(item) > limit:
+            return emit(repr(item[:limit + 1]))
+        return emit(repr(item))
+    
+    def render_container(item: Any, kind: type) -> bool:
+        """Add repr() of a list, tuple or dict to the output."""
+        if kind is list or kind is tuple:
+            if emit('[' if kind is list else '('):
+                return True
+            for i, element in enumerate(item):
+                if (i and emit(', ')) or render(element):
+                    return True
+            if kind is list:
+                return emit(']')
+            return emit(',)' if len(item) == 1 else ')')
+        if emit('{'):
+            return True
+        for i, (key, val) in enumerate(item.items()):
+            if (i and emit(', ')) or render(key) or emit(': ') or render(val):
+                return True
+        return emit('}')
+    
+    if type(value) in (list, tuple, dict):
+        render(value)
+        return ''.join(parts)
+    return str(value)
+
+
+def _truncate(value: Any, limit: int, suffix: str = "... (truncated)") -> str:
+    """Render a value as text, cut to at most limit characters plus suffix.
+    
+    Strings are sliced directly; for other values only about limit characters
+    of text are produced (see _bounded_str), however large the value is.
+    
+    Args:
+        value: The value to render.
+        limit: Maximum number of characters to keep.
+        suffix: Marker appended when the text was cut.
+    
+    Returns:
+        The (possibly truncated) text.
+    """
+    text = value if isinstance(value, str) else _bounded_str(value, limit)
+    if len(text) <= limit:
+        return text
+    return text[:limit] + suffix
+
 
 class StreamingConversationLogger:
     """Callback handler that streams conversation events to a log file in real-time.
     
     This is a callable class that can be passed as a callback to Strands agents.
+    Callbacks only enqueue text; a background thread batches queued text into
+    file writes so disk I/O stays off the agent's streaming path. Call
+    finalize() to flush the queue and close the file.
     """
     
+    # Separator lines and event headers, built once rather than per event
+    _SEP_LIGHT = '─' * 80 + '\n'
+    _SEP_HEAVY = '═' * 80 + '\n'
+    _TOOL_HEADER_FMT = '\n{sep}🔧 TOOL USE: {name}\n{sep}'.format
+    _RESULT_SUCCESS_HEADER = f"\n{_SEP_LIGHT}✓ TOOL RESULT (success)\n{_SEP_LIGHT}"
+    _RESULT_ERROR_HEADER = f"\n{_SEP_LIGHT}❌ TOOL RESULT (error)\n{_SEP_LIGHT}"
+    _TRAILER = f"\n{_SEP_HEAVY}END OF CONVERSATION\n"
+    
+    # Most recent tool-use IDs remembered for de-duplication (oldest evicted)
+    _MAX_TRACKED_IDS = 4096
+    
     def __init__(self, log_path: Path):
         """Initialize the streaming logger.
         
@@ -22,13 +121,28 @@ class StreamingConversationLogger:
         """
         self.log_path = log_path
         self.message_count = 0
-        self._file_handle: Optional[object] = None
+        self._file_handle: Optional[TextIO] = None
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer_thread: Optional[threading.Thread] = None
         self._current_tool_use_id: Optional[str] = None
-        self._logged_tool_uses: set = set()
-        self._logged_tool_results: set = set()
+        self._logged_tool_uses: OrderedDict = OrderedDict()
+        self._logged_tool_results: OrderedDict = OrderedDict()
         
         # Initialize the log file with header
         self._initialize_log()
+        
+        # Keep one handle open for all appends, owned by the writer thread
+        try:
+            self._file_handle = open(self.log_path, 'a', encoding='utf-8')
+        except IOError as e:
+            logger.error("Failed to open streaming log for appending: %s", str(e))
+        else:
+            self._writer_thread = threading.Thread(
+                target=self._drain_queue,
+                name="streaming-log-writer",
+                daemon=True,
+            )
+            self._writer_thread.start()
     
     def __call__(self, **kwargs: Any) -> None:
         """Handle callback events from the agent.
@@ -49,25 +163,21 @@ class StreamingConversationLogger:
             
             # Only log if we haven't logged this result yet
             if tool_use_id and tool_use_id not in self._logged_tool_results:
-                self._logged_tool_results.add(tool_use_id)
+                self._remember(self._logged_tool_results, tool_use_id)
                 
                 status = tool_result.get("status", "unknown")
                 content_items = tool_result.get("content", [])
                 
-                self._append_to_log(f"\n{'─' * 80}\n")
                 if status == "success":
-                    self._append_to_log(f"✓ TOOL RESULT (success)\n")
+                    self._append_to_log(self._RESULT_SUCCESS_HEADER)
                 else:
-                    self._append_to_log(f"❌ TOOL RESULT (error)\n")
-                self._append_to_log(f"{'─' * 80}\n")
+                    self._append_to_log(self._RESULT_ERROR_HEADER)
                 
                 # Log the result content
                 for item in content_items:
                     if isinstance(item, dict) and 'text' in item:
-                        result_text = item['text']
                         # Truncate very long results
-                        if len(result_text) > 1000:
-                            result_text = result_text[:1000] + "\n... (truncated)"
+                        result_text = _truncate(item['text'], 1000, "\n... (truncated)")
                         self._append_to_log(f"{result_text}\n")
                 
                 self._append_to_log("\n")
@@ -88,24 +198,20 @@ class StreamingConversationLogger:
             
             # Only log if this is a new tool use we haven't seen
             if tool_use_id and tool_use_id not in self._logged_tool_uses:
-                self._logged_tool_uses.add(tool_use_id)
+                self._remember(self._logged_tool_uses, tool_use_id)
                 
                 tool_name = current_tool_use.get("name", "unknown")
                 # Try different possible keys for input
                 tool_input = current_tool_use.get("input") or current_tool_use.get("toolInput") or {}
                 
-                self._append_to_log(f"\n{'─' * 80}\n")
-                self._append_to_log(f"🔧 TOOL USE: {tool_name}\n")
-                self._append_to_log(f"{'─' * 80}\n")
+                self._append_to_log(self._TOOL_HEADER_FMT(sep=self._SEP_LIGHT, name=tool_name))
                 
                 if tool_input and isinstance(tool_input, dict):
                     self._append_to_log("Parameters:\n")
                     # Format each parameter on its own line for readability
                     for key, value in tool_input.items():
                         # Truncate long values
-                        value_str = str(value)
-                        if len(value_str) > 200:
-                            value_str = value_str[:200] + "... (truncated)"
+                        value_str = _truncate(value, 200)
                         self._append_to_log(f"  • {key}: {value_str}\n")
                 elif tool_input:
                     # If input exists but isn't a dict, show it as-is
@@ -115,10 +221,21 @@ class StreamingConversationLogger:
                 
                 self._append_to_log("\n")
     
+    def _remember(self, seen: OrderedDict, tool_use_id: str):
+        """Record a tool-use ID as logged, evicting the oldest beyond the cap.
+        
+        Args:
+            seen: The ID tracker to update.
+            tool_use_id: The tool-use ID that was just logged.
+        """
+        seen[tool_use_id] = None
+        if len(seen) > self._MAX_TRACKED_IDS:
+            seen.popitem(last=False)
+    
     def _initialize_log(self):
         """Create the log file and write the header."""
         try:
-            with open(self.log_path, 'w') as f:
+            with open(self.log_path, 'w', encoding='utf-8') as f:
                 f.write(f"╔{'═' * 78}╗\n")
                 f.write(f"║ STREAMING CONVERSATION LOG{' ' * 51}║\n")
                 f.write(f"╚{'═' * 78}╝\n\n")
@@ -133,18 +250,42 @@ class StreamingConversationLogger:
         Args:
             text: Text to append.
         """
-        try:
-            with open(self.log_path, 'a') as f:
-                f.write(text)
-                f.flush()  # Ensure immediate write
-        except IOError as e:
-            logger.error("Failed to append to streaming log: %s", str(e))
+        if self._writer_thread is not None:
+            self._queue.put(text)
     
-
+    def _drain_queue(self):
+        """Writer thread: write everything queued so far in one batch, then flush."""
+        stop = False
+        
+        while not stop:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            if _STOP in batch:
+                # Anything queued after the sentinel came in after finalize()
+                del batch[batch.index(_STOP):]
+                stop = True
+            
+            try:
+                self._file_handle.write(''.join(batch))
+                self._file_handle.flush()  # Keep the log live for readers
+            except Exception as e:
+                # Keep draining whatever goes wrong, so finalize() never hangs
+                logger.error("Failed to append to streaming log: %s", str(e))
+        
+        self._file_handle.close()
     
     def finalize(self):
         """Finalize the log file."""
-        text = f"\n{'═' * 80}\n"
-        text += "END OF CONVERSATION\n"
-        self._append_to_log(text)
+        self._append_to_log(self._TRAILER)
+        
+        if self._writer_thread is not None:
+            self._queue.put(_STOP)
+            self._writer_thread.join()
+            self._writer_thread = None
+            self._file_handle = None
         logger.debug("Finalized streaming log")
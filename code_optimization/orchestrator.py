@@ -5,10 +5,8 @@ optimization process across multiple iterations. It manages the Swarm, tracks
 results, and extracts insights from agent interactions.
 """
 
-import json
 import logging
-import os
-import re
+import shutil
 import time
 from pathlib import Path
 from typing import Optional
@@ -69,10 +67,21 @@ class OptimizationOrchestrator:
         (self.output_dir / "programs").mkdir(exist_ok=True)
         (self.output_dir / "conversations").mkdir(exist_ok=True)
 
-        # Copy initial program to programs folder
-        import shutil
-
+        # Copy initial program to programs folder. copy2 preserves the
+        # modification time, so a matching size and mtime means an earlier
+        # run already copied this version and the copy can be skipped
         dest_path = self.output_dir / "programs" / initial_program_name
+        src_stat = Path(self.initial_program_path).stat()
+        try:
+            dest_stat = dest_path.stat()
+        except FileNotFoundError:
+            dest_stat = None
+        if dest_stat is not None and (dest_stat.st_size, dest_stat.st_mtime_ns) == (
+            src_stat.st_size, src_stat.st_mtime_ns
+        ):
+            logger.info("Initial program already present at %s", dest_path)
+            return
+
         shutil.copy2(self.initial_program_path, dest_path)
         logger.info("Copied initial program to %s", dest_path)
 
@@ -84,6 +93,7 @@ class OptimizationOrchestrator:
         """
         logger.info("Starting optimization process")
         start_time = time.time()
+        streaming_logger = None
 
         try:
             logger.info("Running optimization with program: %s", self.initial_program_path)
@@ -99,6 +109,10 @@ class OptimizationOrchestrator:
             log_path = self.output_dir / "conversations" / "optimization.txt"
             streaming_logger = StreamingConversationLogger(log_path)
 
+            # A fresh Swarm per run, so no conversation history carries over
+            # between runs; the model instances behind the agents are shared
+            # (see agents.models.get_model), so this doesn't set up new
+            # provider clients
             swarm = self._create_swarm()
 
             # Set the callback handler on all agents in the swarm
@@ -113,13 +127,16 @@ class OptimizationOrchestrator:
             swarm_result = swarm(context)
             logger.info("Swarm execution completed")
 
-            # Finalize the streaming log
-            streaming_logger.finalize()
-
         except Exception as e:
             logger.exception("Optimization failed: %s", str(e))
             raise
 
+        finally:
+            # Finalize the streaming log; this also flushes its writer thread,
+            # so it runs on failure and interruption too
+            if streaming_logger is not None:
+                streaming_logger.finalize()
+
     def _build_optimization_context(self, initial_program_name) -> str:
         """Build context for the Swarm.
 
@@ -129,23 +146,16 @@ class OptimizationOrchestrator:
         Returns:
             Formatted context string for the Swarm
         """
-        context_parts = []
-
-        # Add program information
-        context_parts.append(f"Program to Evolve: {initial_program_name}")
-        context_parts.append("")
-
-        # Add task description
-        context_parts.append("TASK:")
-        context_parts.append(
+        return (
+            f"Program to Evolve: {initial_program_name}\n"
+            "\n"
+            "TASK:\n"
             "Analyze the program and propose improvements to the EVOLVE-BLOCK sections. "
             "Follow the experimental methodology: form a hypothesis, implement changes, "
             "analyze results, and document findings."
             f"Store successive programs at {self.output_dir}/programs/vXX_<name>, where XX is the version number."
         )
 
-        return "\n".join(context_parts)
-
     def _create_swarm(
         self,
         model_id: str = None,
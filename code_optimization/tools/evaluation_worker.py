@@ -0,0 +1,83 @@
+"""
+Child process that runs a single evaluation for the Evaluator, used when
+several evaluations run concurrently
+
+Usage: python evaluation_worker.py <evaluation_file> <program_path> <result_file>
+
+Whatever the evaluation function prints goes to this process's own stdout and
+stderr, which the parent captures, so concurrent evaluations never have to
+share or replace the parent's sys.stdout/sys.stderr. The outcome is pickled to
+result_file as one of:
+
+    ("dict", result_dict)
+    ("evaluation_result", {"metrics", "artifacts", "stdout", "stderr"})
+    ("unexpected", type_name)
+    ("error", message, traceback_text)
+
+This file is run by path rather than as a module, so that starting it does not
+import the code_optimization package (and with it the agent framework).
+"""
+
+import importlib.util
+import os
+import pickle
+import sys
+import traceback
+from typing import Any, Callable, Tuple
+
+
+def _load_evaluate_function(evaluation_file: str) -> Callable:
+    """Load the evaluate function the same way the Evaluator does"""
+    # Add the evaluation file's directory to Python path so it can import local modules
+    eval_dir = os.path.dirname(os.path.abspath(evaluation_file))
+    if eval_dir not in sys.path:
+        sys.path.insert(0, eval_dir)
+
+    spec = importlib.util.spec_from_file_location("evaluation_module", evaluation_file)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Failed to load spec from {evaluation_file}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["evaluation_module"] = module
+    spec.loader.exec_module(module)
+    return module.evaluate
+
+
+def _to_outcome(result: Any) -> Tuple:
+    """Convert an evaluation result to a picklable outcome tuple"""
+    if isinstance(result, dict):
+        return ("dict", result)
+    if type(result).__name__ == "EvaluationResult" and hasattr(result, "metrics"):
+        # Sent as plain data since its class may not be importable under the
+        # same name in the parent
+        return (
+            "evaluation_result",
+            {
+                "metrics": result.metrics,
+                "artifacts": getattr(result, "artifacts", None) or {},
+                "stdout": getattr(result, "stdout", None),
+                "stderr": getattr(result, "stderr", None),
+            },
+        )
+    return ("unexpected", repr(type(result)))
+
+
+def main() -> None:
+    # Running by path puts this file's directory first on sys.path; drop it so
+    # its modules can't shadow the evaluation file's imports
+    if sys.path and os.path.abspath(sys.path[0]) == os.path.dirname(os.path.abspath(__file__)):
+        del sys.path[0]
+
+    evaluation_file, program_path, result_file = sys.argv[1:4]
+    try:
+        evaluate = _load_evaluate_function(evaluation_file)
+        data = pickle.dumps(_to_outcome(evaluate(program_path)))
+    except BaseException as e:
+        data = pickle.dumps(("error", str(e), traceback.format_exc()))
+
+    with open(result_file, "wb") as f:
+        f.write(data)
+
+
+if __name__ == "__main__":
+    main()
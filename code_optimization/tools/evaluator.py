@@ -3,10 +3,14 @@ Evaluation system for OpenEvolve
 """
 
 import asyncio
+import contextlib
 import importlib.util
+import io
 import json
 import logging
 import os
+import pickle
+import signal
 import subprocess
 import sys
 import tempfile
@@ -19,6 +23,11 @@ from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Script that runs an evaluation in its own child process, for evaluations that
+# run concurrently
+_EVALUATION_WORKER = str(Path(__file__).with_name("evaluation_worker.py"))
+
+
 @dataclass
 class EvaluatorConfig:
     """Configuration for program evaluation"""
@@ -183,15 +192,18 @@ class Evaluator:
 
     async def evaluate_program(
         self,
-        program_code: str,
+        program_code: Union[str, bytes],
         program_id: str = "",
+        isolated: bool = False,
     ) -> EvaluationResult:
         """
         Evaluate a program and return evaluation result
 
         Args:
-            program_code: Code to evaluate
+            program_code: Code to evaluate, as text or as UTF-8 encoded bytes
             program_id: Optional ID for logging
+            isolated: Run the evaluation function in a child process instead of
+                in this one, so that it can run alongside other evaluations
 
         Returns:
             EvaluationResult with metrics, stdout, stderr, and artifacts
@@ -202,17 +214,21 @@ class Evaluator:
         # Check if artifacts are enabled
         artifacts_enabled = os.environ.get("ENABLE_ARTIFACTS", "true").lower() == "true"
 
+        # Encode once up front; bytes (e.g. read straight from disk) are used as-is
+        if isinstance(program_code, str):
+            program_code = program_code.encode("utf-8")
+
         # Retry logic for evaluation
         last_exception = None
         for attempt in range(self.config.max_retries + 1):
             # Create a temporary file for the program
             with tempfile.NamedTemporaryFile(suffix=self.program_suffix, delete=False) as temp_file:
-                temp_file.write(program_code.encode("utf-8"))
+                temp_file.write(program_code)
                 temp_file_path = temp_file.name
 
             try:
                 # Run evaluation
-                result = await self._direct_evaluate(temp_file_path)
+                result = await self._direct_evaluate(temp_file_path, isolated)
 
                 # Process the result based on type
                 eval_result = self._process_evaluation_result(result)
@@ -298,6 +314,36 @@ class Evaluator:
         )
         return EvaluationResult(metrics={"error": 0.0})
 
+    async def evaluate_programs(
+        self,
+        programs: List[Tuple[Union[str, bytes], str]],
+    ) -> List[EvaluationResult]:
+        """
+        Evaluate several programs concurrently
+
+        At most config.parallel_evaluations evaluations run at the same time.
+        When more than one can run at once, each runs in its own child process.
+
+        Args:
+            programs: (program_code, program_id) pairs to evaluate
+
+        Returns:
+            One EvaluationResult per program, in the same order as programs
+        """
+        parallel_evaluations = max(1, self.config.parallel_evaluations)
+        semaphore = asyncio.Semaphore(parallel_evaluations)
+
+        # Evaluations only need their own processes when they overlap
+        isolated = parallel_evaluations > 1 and len(programs) > 1
+
+        async def evaluate_one(program_code: Union[str, bytes], program_id: str) -> EvaluationResult:
+            async with semaphore:
+                return await self.evaluate_program(program_code, program_id, isolated)
+
+        return await asyncio.gather(
+            *(evaluate_one(program_code, program_id) for program_code, program_id in programs)
+        )
+
     def _process_evaluation_result(self, result: Any) -> EvaluationResult:
         """
         Process evaluation result to handle both dict and EvaluationResult returns
@@ -331,14 +377,84 @@ class Evaluator:
         """
         return self._pending_artifacts.pop(program_id, None)
 
+    async def _evaluate_in_child_process(self, program_path: str) -> Tuple[Any, str, str]:
+        """
+        Run the evaluation function on a program in a child process
+
+        The child's output is read from its own stdout/stderr, so this process's
+        sys.stdout/sys.stderr are never replaced, and if the evaluation is
+        cancelled (by the timeout) the child and anything it started are killed.
+
+        Args:
+            program_path: Path to the program file
+
+        Returns:
+            (result, stdout_text, stderr_text)
+
+        Raises:
+            RuntimeError: If the evaluation function raises an exception or the
+                child process exits without a result
+        """
+        result_fd, result_path = tempfile.mkstemp(suffix=".pickle")
+        os.close(result_fd)
+        try:
+            process = await asyncio.create_subprocess_exec(
+                sys.executable,
+                _EVALUATION_WORKER,
+                self.evaluation_file,
+                program_path,
+                result_path,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True,
+            )
+            try:
+                stdout, stderr = await process.communicate()
+            except BaseException:
+                # Cancelled: kill the whole process group
+                with contextlib.suppress(ProcessLookupError):
+                    os.killpg(process.pid, signal.SIGKILL)
+                await process.wait()
+                raise
+
+            with open(result_path, "rb") as f:
+                outcome = f.read()
+        finally:
+            os.unlink(result_path)
+
+        stdout_text = stdout.decode("utf-8", errors="replace")
+        stderr_text = stderr.decode("utf-8", errors="replace")
+
+        if not outcome:
+            raise RuntimeError(
+                f"Evaluation process exited with code {process.returncode} "
+                f"without a result: {stderr_text.strip()}"
+            )
+        kind, *payload = pickle.loads(outcome)
+
+        if kind == "error":
+            message, child_traceback = payload
+            logger.debug(f"Evaluation function raised:\n{child_traceback}")
+            raise RuntimeError(message)
+        elif kind == "unexpected":
+            logger.warning(f"Unexpected evaluation result type: {payload[0]}")
+            result = EvaluationResult(metrics={"error": 0.0})
+        elif kind == "evaluation_result":
+            result = EvaluationResult(**payload[0])
+        else:
+            result = payload[0]
+
+        return result, stdout_text, stderr_text
+
     async def _direct_evaluate(
-        self, program_path: str
+        self, program_path: str, isolated: bool = False
     ) -> Union[Dict[str, float], EvaluationResult]:
         """
         Directly evaluate a program using the evaluation function with timeout
 
         Args:
             program_path: Path to the program file
+            isolated: Run the evaluation function in a child process
 
         Returns:
             Dictionary of metrics or EvaluationResult with metrics and artifacts
@@ -349,23 +465,25 @@ class Evaluator:
         """
 
         # Create a coroutine that runs the evaluation function in an executor
-        # with stdout/stderr capture
+        # (or a child process) with stdout/stderr capture
         async def run_evaluation():
-            loop = asyncio.get_event_loop()
-            
-            # Capture stdout and stderr
-            import io
-            import contextlib
-            
-            stdout_capture = io.StringIO()
-            stderr_capture = io.StringIO()
-            
-            with contextlib.redirect_stdout(stdout_capture), contextlib.redirect_stderr(stderr_capture):
-                result = await loop.run_in_executor(None, self.evaluate_function, program_path)
-            
-            # Get captured output
-            stdout_text = stdout_capture.getvalue()
-            stderr_text = stderr_capture.getvalue()
+            if isolated:
+                result, stdout_text, stderr_text = await self._evaluate_in_child_process(
+                    program_path
+                )
+            else:
+                loop = asyncio.get_event_loop()
+                
+                # Capture stdout and stderr
+                stdout_capture = io.StringIO()
+                stderr_capture = io.StringIO()
+                
+                with contextlib.redirect_stdout(stdout_capture), contextlib.redirect_stderr(stderr_capture):
+                    result = await loop.run_in_executor(None, self.evaluate_function, program_path)
+                
+                # Get captured output
+                stdout_text = stdout_capture.getvalue()
+                stderr_text = stderr_capture.getvalue()
             
             # If result is a dict, convert to EvaluationResult and add stdout/stderr
             if isinstance(result, dict):
@@ -7,22 +7,98 @@ This module provides tools that enable the Researcher Agent to:
 """
 
 import logging
+import os
+import signal
 import subprocess
+import threading
+import time
+from collections import deque
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, TextIO
 
 import strands
 from ..core.program_manager import ProgramManager
 from ..core.evolve_block import EvolveBlock
-from ..tools.evaluator import Evaluator, EvaluatorConfig
+
+if TYPE_CHECKING:
+    from ..tools.evaluator import Evaluator
 
 logger = logging.getLogger(__name__)
 
 # Initialize a shared ProgramManager instance
 _program_manager = ProgramManager()
 
-# Initialize a shared Evaluator instance (will be set when evaluate_program is first called)
-_evaluator: Optional[Evaluator] = None
+# Evaluators keyed by the real path of the evaluation file, each stored with the
+# (mtime_ns, timeout) it was created for. Repeated evaluate_program calls reuse
+# the evaluation module loaded into this process, instead of executing it again,
+# until the file or timeout changes, which replaces the entry
+_evaluators: dict[str, tuple[tuple[int, int], "Evaluator"]] = {}
+
+# Event loops for running the async evaluator from sync tool calls, kept open
+# between calls. One per thread, since tools may run on worker threads and a
+# loop can only run in one thread at a time
+_event_loops = threading.local()
+
+
+def _get_event_loop():
+    """Return this thread's evaluation event loop, creating it on first use."""
+    import asyncio
+
+    loop = getattr(_event_loops, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        _event_loops.loop = loop
+    return loop
+
+
+# Most recent output kept per stream by execute_shell: at most this many lines,
+# and at most this many characters in total
+_SHELL_OUTPUT_MAX_LINES = 2048
+_SHELL_OUTPUT_MAX_CHARS = 256 * 1024
+
+# Longest piece read from an output pipe at once; longer lines are read in
+# pieces so a single huge line can't be held in full
+_SHELL_READ_SIZE = 64 * 1024
+
+# Seconds to wait for output pipes to close after killing a timed-out command
+_PIPE_DRAIN_GRACE = 1.0
+
+
+class _OutputTail:
+    """Drains a text pipe on a background thread, keeping the end of its output."""
+
+    def __init__(self, stream: TextIO, max_lines: int, max_chars: int):
+        self._pieces: deque[str] = deque()
+        self._max_lines = max_lines
+        self._max_chars = max_chars
+        self._chars = 0
+        self._total_chars = 0
+        self._thread = threading.Thread(target=self._drain, args=(stream,), daemon=True)
+        self._thread.start()
+
+    def _drain(self, stream: TextIO) -> None:
+        with stream:
+            for piece in iter(lambda: stream.readline(_SHELL_READ_SIZE), ""):
+                self._pieces.append(piece)
+                self._chars += len(piece)
+                self._total_chars += len(piece)
+                while len(self._pieces) > self._max_lines or self._chars > self._max_chars:
+                    self._chars -= len(self._pieces.popleft())
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        self._thread.join(timeout)
+
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def text(self) -> str:
+        """Return the kept output, noting how much earlier output was dropped."""
+        text = "".join(self._pieces)
+        omitted = self._total_chars - len(text)
+        if omitted > 0:
+            return f"... ({omitted} earlier characters omitted)\n" + text
+        return text
 
 
 @strands.tool
@@ -45,9 +121,21 @@ def read_file(file_path: str) -> str:
     logger.debug("Tool read_file called with file_path: %s", file_path)
     
     try:
-        path = Path(file_path)
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Read the raw bytes in as few read() calls as possible (the file
+        # size is known up front) and decode them once
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            chunk_size = max(os.fstat(fd).st_size, 1 << 16)
+            chunks = []
+            while chunk := os.read(fd, chunk_size):
+                chunks.append(chunk)
+        finally:
+            os.close(fd)
+        content = b''.join(chunks).decode('utf-8')
+        
+        # Match text-mode reads, which translate \r\n and \r line endings
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
         logger.debug("Successfully read %d characters from %s", len(content), file_path)
         return content
     except FileNotFoundError:
@@ -83,8 +171,15 @@ def write_file(file_path: str, content: str) -> str:
         # Create parent directories if they don't exist
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Encode once and hand the bytes straight to the OS, bypassing the
+        # buffered text layer; loop in case of a short write
+        data = memoryview(content.encode('utf-8'))
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
         
         logger.info("Successfully wrote %d characters to %s", len(content), file_path)
         return f"Successfully wrote {len(content)} characters to {file_path}"
@@ -101,7 +196,9 @@ def execute_shell(command: str, timeout: Optional[int] = 30) -> str:
     """Execute a shell command and capture its output.
     
     Use this tool to run experiments, execute programs, or perform system operations.
-    Both stdout and stderr are captured and returned.
+    Both stdout and stderr are captured and returned; for very long output only
+    the last 2048 lines (and at most 256 KB) of each are kept. If the command
+    times out, the output it produced so far is included with the error.
     
     Args:
         command: The shell command to execute.
@@ -114,44 +211,92 @@ def execute_shell(command: str, timeout: Optional[int] = 30) -> str:
     logger.debug("Tool execute_shell called with command: %s, timeout: %d", command, timeout)
     
     try:
-        result = subprocess.run(
+        # Drain both pipes on background threads, keeping only the end of
+        # each, so chatty commands can't grow memory without bound and
+        # whatever was printed before a timeout is still available
+        process = subprocess.Popen(
             command,
             shell=True,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=timeout
+            errors="replace",
+            # Own process group, so a timeout can kill everything the shell started
+            start_new_session=True,
         )
+        stdout_tail = _OutputTail(process.stdout, _SHELL_OUTPUT_MAX_LINES, _SHELL_OUTPUT_MAX_CHARS)
+        stderr_tail = _OutputTail(process.stderr, _SHELL_OUTPUT_MAX_LINES, _SHELL_OUTPUT_MAX_CHARS)
+        
+        # The timeout covers both the command and draining its output
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            try:
+                returncode = process.wait(timeout=timeout)
+                for tail in (stdout_tail, stderr_tail):
+                    tail.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+                    if tail.is_alive():
+                        raise subprocess.TimeoutExpired(command, timeout)
+            except BaseException:
+                # Kill the whole process group on a timeout and on any other
+                # way out, such as Ctrl-C, which doesn't reach the command's
+                # own session. Killing only the shell would leave its children
+                # running and holding the output pipes open
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                process.wait()
+                stdout_tail.join(_PIPE_DRAIN_GRACE)
+                stderr_tail.join(_PIPE_DRAIN_GRACE)
+                raise
+        except subprocess.TimeoutExpired:
+            logger.error("Command timed out after %d seconds: %s", timeout, command)
+            
+            partial_output = _combine_shell_output(stdout_tail.text(), stderr_tail.text())
+            if partial_output:
+                return (
+                    f"Error: Command timed out after {timeout} seconds\n\n"
+                    f"Output before timeout:\n{partial_output}"
+                )
+            return f"Error: Command timed out after {timeout} seconds"
         
-        logger.debug("Command completed with return code: %d", result.returncode)
+        logger.debug("Command completed with return code: %d", returncode)
         
         # Combine stdout and stderr
-        output = ""
-        if result.stdout:
-            output += "STDOUT:\n" + result.stdout
-            logger.debug("Captured stdout: %d characters", len(result.stdout))
-        if result.stderr:
-            if output:
-                output += "\n\n"
-            output += "STDERR:\n" + result.stderr
-            logger.debug("Captured stderr: %d characters", len(result.stderr))
+        stdout_text = stdout_tail.text()
+        stderr_text = stderr_tail.text()
+        if stdout_text:
+            logger.debug("Captured stdout: %d characters", len(stdout_text))
+        if stderr_text:
+            logger.debug("Captured stderr: %d characters", len(stderr_text))
+        output = _combine_shell_output(stdout_text, stderr_text)
         
         # Include return code information
-        if result.returncode != 0:
-            output = f"Command exited with code {result.returncode}\n\n" + output
-            logger.warning("Command failed with return code: %d", result.returncode)
+        if returncode != 0:
+            output = f"Command exited with code {returncode}\n\n" + output
+            logger.warning("Command failed with return code: %d", returncode)
         else:
             logger.info("Command executed successfully")
         
         return output if output else "Command completed with no output"
         
-    except subprocess.TimeoutExpired:
-        logger.error("Command timed out after %d seconds: %s", timeout, command)
-        return f"Error: Command timed out after {timeout} seconds"
     except Exception as e:
         logger.exception("Error executing command: %s", command)
         return f"Error executing command: {str(e)}"
 
 
+def _combine_shell_output(stdout_text: str, stderr_text: str) -> str:
+    """Format captured stdout and stderr as execute_shell reports them."""
+    output = ""
+    if stdout_text:
+        output += "STDOUT:\n" + stdout_text
+    if stderr_text:
+        if output:
+            output += "\n\n"
+        output += "STDERR:\n" + stderr_text
+    return output
+
+
 @strands.tool
 def parse_evolve_blocks(program_path: str) -> str:
     """Extract EVOLVE-BLOCK sections from a program file.
@@ -174,15 +319,17 @@ def parse_evolve_blocks(program_path: str) -> str:
         if not blocks:
             return f"No EVOLVE-BLOCKs found in {program_path}"
         
-        result = f"Found {len(blocks)} EVOLVE-BLOCK(s) in {program_path}:\n\n"
+        parts = [f"Found {len(blocks)} EVOLVE-BLOCK(s) in {program_path}:\n\n"]
         
         for block in blocks:
-            result += f"Block ID: {block.block_id}\n"
-            result += f"Lines: {block.start_line + 1} to {block.end_line + 1}\n"
-            result += f"Content:\n{block.content}\n"
-            result += "-" * 60 + "\n\n"
+            parts.append(
+                f"Block ID: {block.block_id}\n"
+                f"Lines: {block.start_line + 1} to {block.end_line + 1}\n"
+                f"Content:\n{block.content}\n"
+                f"{'-' * 60}\n\n"
+            )
         
-        return result
+        return "".join(parts)
         
     except FileNotFoundError:
         return f"Error: File not found: {program_path}"
@@ -227,6 +374,12 @@ def replace_evolve_blocks(
         # Split by separator
         sections = block_modifications.strip().split('---')
 
+        # Parse the original blocks once; they supply the line numbers for
+        # every section below
+        original_blocks = _program_manager.extract_evolve_blocks(program_path)
+        original_by_id = {orig.block_id: orig for orig in original_blocks}
+        modified_ids = set()
+
         for section in sections:
             section = section.strip()
             if not section:
@@ -248,18 +401,13 @@ def replace_evolve_blocks(
 
             content = lines[1] if len(lines) > 1 else ""
 
-            # Get the original block to preserve line numbers
-            original_blocks = _program_manager.extract_evolve_blocks(program_path)
-
-            # Find the matching original block
-            original_block = None
-            for orig in original_blocks:
-                if orig.block_id == block_id:
-                    original_block = orig
-                    break
-
+            # Find the matching original block to preserve line numbers
+            original_block = original_by_id.get(block_id)
             if original_block is None:
                 return f"Error: Block ID {block_id} not found in {program_path}"
+            if block_id in modified_ids:
+                return f"Error: Block ID {block_id} is given more than once"
+            modified_ids.add(block_id)
 
             # Create new block with updated content but original line numbers
             new_block = EvolveBlock(
@@ -273,11 +421,13 @@ def replace_evolve_blocks(
         if not blocks_to_replace:
             return "Error: No valid block modifications found in the input"
 
-        # Perform the replacement
+        # Perform the replacement. The IDs were checked above to be unique
+        # and present in the program, so only the block count is left to check
         _program_manager.replace_evolve_blocks(
             program_path,
             blocks_to_replace,
-            output_path
+            output_path,
+            validate=False
         )
 
         return f"Successfully created modified program at {output_path} with {len(blocks_to_replace)} block(s) updated"
@@ -290,6 +440,98 @@ def replace_evolve_blocks(
         return f"Unexpected error: {str(e)}"
 
 
+def _get_evaluator(evaluation_file: str, timeout: int) -> "Evaluator":
+    """Return the evaluator for an evaluation file and timeout, reusing a cached one."""
+    real_path = os.path.realpath(evaluation_file)
+    signature = (os.stat(real_path).st_mtime_ns, timeout)
+    cached = _evaluators.get(real_path)
+    evaluator = cached[1] if cached is not None and cached[0] == signature else None
+    if evaluator is None:
+        # Only evaluations need the evaluator machinery; load it on demand
+        from ..tools.evaluator import Evaluator, EvaluatorConfig
+
+        config = EvaluatorConfig(
+            timeout=timeout,
+            max_retries=1,
+            parallel_evaluations=os.cpu_count() or 1,
+        )
+        evaluator = Evaluator(config=config, evaluation_file=evaluation_file)
+        _evaluators[real_path] = (signature, evaluator)
+    else:
+        logger.debug("Reusing evaluator for %s", evaluation_file)
+
+    return evaluator
+
+
+def _report_evaluation(program_path: str, result) -> str:
+    """Format an evaluation result and save it next to the program.
+
+    The report is written to <program stem>_evaluation.txt in the program's
+    folder.
+
+    Args:
+        program_path: Path to the evaluated program.
+        result: The EvaluationResult for the program.
+
+    Returns:
+        The formatted report, followed by where it was saved (or a warning if
+        it could not be saved).
+    """
+    # Format the results
+    parts = [
+        f"Evaluation Results for {program_path}:\n",
+        "=" * 60 + "\n\n",
+    ]
+
+    # Display metrics
+    parts.append("Metrics:\n")
+    for metric_name, metric_value in result.metrics.items():
+        if isinstance(metric_value, float):
+            parts.append(f"  {metric_name}: {metric_value:.4f}\n")
+        else:
+            parts.append(f"  {metric_name}: {metric_value}\n")
+
+    # Display stdout if present
+    if result.stdout:
+        parts.append("\nProgram Output (stdout):\n")
+        parts.append("-" * 60 + "\n")
+        parts.append(result.stdout)
+        parts.append("\n")
+
+    # Display stderr if present
+    if result.stderr:
+        parts.append("\nProgram Errors (stderr):\n")
+        parts.append("-" * 60 + "\n")
+        parts.append(result.stderr)
+        parts.append("\n")
+
+    # Display artifacts if present
+    if result.has_artifacts():
+        parts.append("\nArtifacts:\n")
+        for key in result.get_artifact_keys():
+            size = result.get_artifact_size(key)
+            parts.append(f"  {key}: {size} bytes\n")
+
+    output = "".join(parts)
+
+    # Write output to file in the same folder as program_path
+    program_path_obj = Path(program_path)
+    output_file = (
+        program_path_obj.parent / f"{program_path_obj.stem}_evaluation.txt"
+    )
+
+    try:
+        with open(output_file, "w", encoding="utf-8") as f:
+            f.write(output)
+        logger.info("Evaluation results written to %s", output_file)
+        output += f"\n{'=' * 60}\nResults saved to: {output_file}\n"
+    except IOError as e:
+        logger.error("Failed to write evaluation results to file: %s", str(e))
+        output += f"\nWarning: Could not save results to file: {str(e)}\n"
+
+    return output
+
+
 @strands.tool
 def evaluate_program(
     program_path: str, evaluation_file: str, timeout: Optional[int] = 60
@@ -308,8 +550,6 @@ def evaluate_program(
     Returns:
         A formatted string containing the evaluation metrics, or an error message.
     """
-    global _evaluator
-
     logger.debug(
         "Tool evaluate_program called with program_path: %s, evaluation_file: %s, timeout: %d",
         program_path,
@@ -319,98 +559,44 @@ def evaluate_program(
 
     try:
         # Check if program file exists
-        if not Path(program_path).exists():
+        if not os.path.isfile(program_path):
             return f"Error: Program file not found: {program_path}"
 
         # Check if evaluation file exists
-        if not Path(evaluation_file).exists():
+        if not os.path.isfile(evaluation_file):
             return f"Error: Evaluation file not found: {evaluation_file}"
 
-        # Initialize or reinitialize evaluator if needed
-        config = EvaluatorConfig(timeout=timeout, max_retries=1)
-        _evaluator = Evaluator(config=config, evaluation_file=evaluation_file)
+        evaluator = _get_evaluator(evaluation_file, timeout)
 
         logger.info("Starting evaluation of %s", program_path)
 
-        # Read the program code
-        with open(program_path, "r", encoding="utf-8") as f:
-            program_code = f.read()
+        # Read the program as raw bytes; the evaluator only copies them into a
+        # temporary file, so there is no need to decode and re-encode them
+        program_code = Path(program_path).read_bytes()
 
         # Run evaluation (this is async, so we need to handle it)
         import asyncio
 
-        # Check if we're already in an event loop
-        try:
-            loop = asyncio.get_running_loop()
-            # We're in an async context, create a task
-            result = asyncio.create_task(
-                _evaluator.evaluate_program(program_code, program_path)
-            )
-            # This won't work in sync context, so we need to use run_until_complete
-            # But we can't do that in an existing loop, so we'll use a different approach
+        # Check if we're already in an event loop (without raising when not)
+        if asyncio._get_running_loop() is not None:
+            # run_until_complete can't be used inside a running loop
             logger.warning(
-                "Running in async context, evaluation may not complete immediately"
+                "Running in async context, evaluation cannot be run synchronously"
             )
             return "Error: evaluate_program tool cannot be called from async context. Use execute_shell to run evaluation script instead."
-        except RuntimeError:
-            # No event loop running, we can create one
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result = loop.run_until_complete(
-                    _evaluator.evaluate_program(program_code, program_path)
-                )
-            finally:
-                loop.close()
-
-        # Format the results
-        output = f"Evaluation Results for {program_path}:\n"
-        output += "=" * 60 + "\n\n"
-
-        # Display metrics
-        output += "Metrics:\n"
-        for metric_name, metric_value in result.metrics.items():
-            if isinstance(metric_value, float):
-                output += f"  {metric_name}: {metric_value:.4f}\n"
-            else:
-                output += f"  {metric_name}: {metric_value}\n"
-
-        # Display stdout if present
-        if result.stdout:
-            output += "\nProgram Output (stdout):\n"
-            output += "-" * 60 + "\n"
-            output += result.stdout
-            output += "\n"
-
-        # Display stderr if present
-        if result.stderr:
-            output += "\nProgram Errors (stderr):\n"
-            output += "-" * 60 + "\n"
-            output += result.stderr
-            output += "\n"
-
-        # Display artifacts if present
-        if result.has_artifacts():
-            output += "\nArtifacts:\n"
-            for key in result.get_artifact_keys():
-                size = result.get_artifact_size(key)
-                output += f"  {key}: {size} bytes\n"
-
-        # Write output to file in the same folder as program_path
-        program_path_obj = Path(program_path)
-        output_file = (
-            program_path_obj.parent / f"{program_path_obj.stem}_evaluation.txt"
-        )
 
+        # No event loop running, so run on this thread's reusable loop
+        loop = _get_event_loop()
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(output)
-            logger.info("Evaluation results written to %s", output_file)
-            output += f"\n{'=' * 60}\n"
-            output += f"Results saved to: {output_file}\n"
-        except IOError as e:
-            logger.error("Failed to write evaluation results to file: %s", str(e))
-            output += f"\nWarning: Could not save results to file: {str(e)}\n"
+            result = loop.run_until_complete(
+                evaluator.evaluate_program(program_code, program_path)
+            )
+        finally:
+            # The result already carries the artifacts; don't let the cached
+            # evaluator accumulate a copy per evaluated program
+            evaluator.get_pending_artifacts(program_path)
+
+        output = _report_evaluation(program_path, result)
 
         logger.info("Evaluation completed successfully")
         return output
@@ -418,3 +604,75 @@ def evaluate_program(
     except Exception as e:
         logger.exception("Error evaluating program %s", program_path)
         return f"Error evaluating program: {str(e)}"
+
+
+@strands.tool
+def evaluate_programs(
+    program_paths: list[str], evaluation_file: str, timeout: Optional[int] = 60
+) -> str:
+    """Evaluate several programs at once using the specified evaluation file.
+
+    Use this tool instead of repeated evaluate_program calls when comparing
+    multiple candidate programs: the programs are evaluated concurrently.
+    As with evaluate_program, each program's results are also saved next to it.
+
+    Args:
+        program_paths: Paths to the program files to evaluate.
+        evaluation_file: Path to the evaluation module (Python file with 'evaluate' function).
+        timeout: Maximum time in seconds to wait for each evaluation (default: 60).
+
+    Returns:
+        The evaluation results for each program, in the given order, or an
+        error message.
+    """
+    logger.debug(
+        "Tool evaluate_programs called with %d programs, evaluation_file: %s, timeout: %d",
+        len(program_paths),
+        evaluation_file,
+        timeout,
+    )
+
+    try:
+        if not program_paths:
+            return "Error: No program files given to evaluate"
+
+        # Check that all program files exist before evaluating any of them
+        missing = [path for path in program_paths if not os.path.isfile(path)]
+        if missing:
+            return f"Error: Program file not found: {', '.join(missing)}"
+
+        # Check if evaluation file exists
+        if not os.path.isfile(evaluation_file):
+            return f"Error: Evaluation file not found: {evaluation_file}"
+
+        evaluator = _get_evaluator(evaluation_file, timeout)
+
+        import asyncio
+
+        if asyncio._get_running_loop() is not None:
+            logger.warning(
+                "Running in async context, evaluation cannot be run synchronously"
+            )
+            return "Error: evaluate_programs tool cannot be called from async context. Use execute_shell to run evaluation script instead."
+
+        logger.info("Starting evaluation of %d programs", len(program_paths))
+
+        programs = [(Path(path).read_bytes(), path) for path in program_paths]
+        loop = _get_event_loop()
+        try:
+            results = loop.run_until_complete(evaluator.evaluate_programs(programs))
+        finally:
+            for path in program_paths:
+                evaluator.get_pending_artifacts(path)
+
+        output = "\n".join(
+            _report_evaluation(path, result)
+            for path, result in zip(program_paths, results)
+        )
+
+        logger.info("Evaluation of %d programs completed", len(program_paths))
+        return output
+
+    except Exception as e:
+        logger.exception("Error evaluating programs %s", program_paths)
+        return f"Error evaluating programs: {str(e)}"
@@ -11,6 +11,10 @@ import sys
 import subprocess
 import re
 
+# Per-size timing ("Size  100: 0.283 ms", group 1) or the total time
+# ("Total time: 8.969 ms", group 2), so one pass over the output finds both
+_TIMING_RE = re.compile(r'Size[^\n]*?(\d+\.\d+)\s*ms|Total time:\s*(\d+\.\d+)\s*ms')
+
 
 def evaluate(program_path: str) -> dict:
     """
@@ -49,23 +53,17 @@ def evaluate(program_path: str) -> dict:
                 'artifacts': {'error': 'Sorting correctness error'}
             }
         
-        # Parse timing information
+        # Parse per-size times and the total time with one regex pass; the
+        # program prints the total last, so parsing stops there
         times = []
-        for line in output.split('\n'):
-            if 'Size' in line and 'ms' in line:
-                # Extract time in milliseconds
-                match = re.search(r'(\d+\.\d+)\s*ms', line)
-                if match:
-                    times.append(float(match.group(1)))
-        
-        # Extract total time
         total_time = None
-        for line in output.split('\n'):
-            if 'Total time:' in line:
-                match = re.search(r'(\d+\.\d+)\s*ms', line)
-                if match:
-                    total_time = float(match.group(1))
-                    break
+        for match in _TIMING_RE.finditer(output):
+            size_time, total = match.groups()
+            if size_time is not None:
+                times.append(float(size_time))
+            else:
+                total_time = float(total)
+                break
         
         if total_time is None or not times:
             return {
@@ -74,9 +72,9 @@ def evaluate(program_path: str) -> dict:
             }
         
         # Calculate performance score
-        # Baseline: bubble sort takes ~1000ms total for our test sizes
-        # Better algorithms should be much faster
-        baseline_time = 1000.0  # ms
+        # Baseline: the initial program (list.sort) takes ~0.07ms total for
+        # our test sizes, so it scores ~0.5 here and faster sorts score higher
+        baseline_time = 0.07  # ms
         
         # Score based on speedup over baseline
         # Score = 1 / (1 + time/baseline)
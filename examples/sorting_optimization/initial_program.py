@@ -4,8 +4,8 @@ Initial program for sorting algorithm optimization example.
 This program sorts arrays of integers. The goal is to evolve
 a more efficient sorting implementation.
 
-The initial implementation uses a simple bubble sort, which is
-inefficient for large arrays (O(n²) time complexity).
+The implementation delegates to the built-in Timsort (O(n log n),
+implemented in C) rather than sorting element by element in Python.
 """
 
 import random
@@ -21,16 +21,10 @@ def sort_array(arr):
     """
     Sort an array of integers in ascending order.
     
-    Current implementation: Bubble sort (inefficient!)
+    Current implementation: list.sort (CPython's Timsort, implemented in C)
     """
     arr = arr.copy()  # Don't modify the original
-    n = len(arr)
-    
-    for i in range(n):
-        for j in range(0, n - i - 1):
-            if arr[j] > arr[j + 1]:
-                arr[j], arr[j + 1] = arr[j + 1], arr[j]
-    
+    arr.sort()
     return arr
 # EVOLVE-BLOCK-END
 
@@ -12,34 +12,152 @@ Examples:
 """
 
 import argparse
+import itertools
 import json
+import math
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import matplotlib.pyplot as plt
 
+# orjson is optional; it parses checkpoint JSON several times faster
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+
+    def _json_loads(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals json.dump writes for
+            # non-finite metrics; the stdlib parser accepts them
+            return json.loads(data)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+
+# Parse results from previous runs, stored in the programs directory. The name
+# must not end in .json, which would mark the directory as OpenEvolve output.
+METRICS_CACHE_FILE = '.metrics_cache'
+
 
 def parse_evaluation_file(filepath):
-    """Parse an evaluation file and extract metrics."""
+    """Parse an evaluation file and extract metrics.
+    
+    Metrics are the indented "name: value" lines following the "Metrics:"
+    header, where value is a plain non-negative decimal such as 12 or 0.5;
+    the section ends at the first line that is not one.
+    """
     with open(filepath, 'r') as f:
         content = f.read()
     
     metrics = {}
     # Extract only the Metrics section
-    metrics_section = re.search(r'Metrics:\s*\n((?:\s+\w+:\s+[\d.]+\s*\n)+)', content)
+    start = content.find('Metrics:')
+    if start < 0:
+        return metrics
     
-    if metrics_section:
-        metrics_text = metrics_section.group(1)
-        # Extract metrics using regex - now only from the Metrics section
-        metric_pattern = r'(\w+):\s+([\d.]+)'
-        for match in re.finditer(metric_pattern, metrics_text):
-            metric_name = match.group(1)
-            metric_value = float(match.group(2))
-            metrics[metric_name] = metric_value
+    for line in content[start:].splitlines(keepends=True)[1:]:
+        if not line.strip():
+            continue  # Blank lines may separate metric lines
+        if line[0] not in ' \t' or not line.endswith('\n'):
+            break
+        metric_name, sep, metric_value = line.partition(':')
+        metric_name = metric_name.strip()
+        if not sep or not metric_name.replace('_', 'a').isalnum():
+            break
+        metric_value = metric_value.strip()
+        # float() alone would also accept signs, exponents, inf and nan
+        if not (metric_value.isascii() and metric_value.replace('.', '').isdigit()):
+            break
+        try:
+            metrics[metric_name] = float(metric_value)
+        except ValueError:
+            break
     
     return metrics
 
 
+def load_json_file(json_file):
+    """Load the fields used for plotting from an OpenEvolve JSON file.
+    
+    Returns the decode error instead of raising it.
+    """
+    try:
+        with open(json_file, 'rb') as f:
+            data = _json_loads(f.read())
+    except json.JSONDecodeError as e:
+        return e
+    return {'iteration_found': data.get('iteration_found'), 'metrics': data.get('metrics', {})}
+
+
+def load_metrics_cache(programs_path):
+    """Load the cached parse results for a programs directory (empty if none)."""
+    try:
+        with open(programs_path / METRICS_CACHE_FILE, 'rb') as f:
+            cache = _json_loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_metrics_cache(programs_path, cache, file_names):
+    """Save the cache entries for file_names, dropping those of removed files."""
+    cache = {name: cache[name] for name in file_names if name in cache}
+    try:
+        data = _json_dumps(cache)
+        with open(programs_path / METRICS_CACHE_FILE, 'wb') as f:
+            f.write(data)
+    except (OSError, TypeError):
+        pass  # The cache is optional; e.g. the directory may be read-only
+
+
+def is_finite_json(obj):
+    """Return whether obj has no inf or NaN floats, which JSON cannot represent."""
+    if isinstance(obj, float):
+        return math.isfinite(obj)
+    if isinstance(obj, dict):
+        return all(map(is_finite_json, obj.values()))
+    if isinstance(obj, list):
+        return all(map(is_finite_json, obj))
+    return True
+
+
+def load_cached(path, load, cache):
+    """Return load(path), reusing the cached result while the file is unchanged.
+    
+    Args:
+        path: File to load.
+        load: Function parsing the file. Exceptions it returns, and results
+            with inf or NaN values (orjson would store them as null), are not
+            cached.
+        cache: Dict from file name to [mtime_ns, size, result], updated in place.
+    
+    Returns:
+        The loaded result, or None if the file does not exist.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        cache.pop(path.name, None)
+        return None
+    signature = [st.st_mtime_ns, st.st_size]
+    
+    entry = cache.get(path.name)
+    if isinstance(entry, list) and entry[:2] == signature:
+        return entry[2]
+    
+    result = load(path)
+    if not isinstance(result, Exception) and is_finite_json(result):
+        cache[path.name] = signature + [result]
+    else:
+        cache.pop(path.name, None)
+    return result
+
+
 def collect_metrics_openevolve(programs_dir):
     """Collect metrics from OpenEvolve JSON files."""
     programs_path = Path(programs_dir)
@@ -50,20 +168,24 @@ def collect_metrics_openevolve(programs_dir):
     versions = []
     all_metrics = []
     
-    for json_file in json_files:
-        try:
-            with open(json_file, 'r') as f:
-                data = json.load(f)
-            
-            # Extract iteration_found as version number
-            version_num = data.get('iteration_found')
-            if version_num is not None:
-                versions.append(version_num)
-                # Extract metrics from the metrics field
-                metrics = data.get('metrics', {})
-                all_metrics.append(metrics)
-        except (json.JSONDecodeError, KeyError) as e:
-            print(f"Warning: Could not parse {json_file.name}: {e}")
+    # Read and parse changed files concurrently; map() keeps them in order
+    cache = load_metrics_cache(programs_path)
+    with ThreadPoolExecutor() as executor:
+        loaded = list(executor.map(lambda p: load_cached(p, load_json_file, cache), json_files))
+    save_metrics_cache(programs_path, cache, [p.name for p in json_files])
+    
+    for json_file, data in zip(json_files, loaded):
+        if isinstance(data, json.JSONDecodeError):
+            print(f"Warning: Could not parse {json_file.name}: {data}")
+            continue
+        
+        # Extract iteration_found as version number
+        version_num = data.get('iteration_found')
+        if version_num is not None:
+            versions.append(version_num)
+            # Extract metrics from the metrics field
+            metrics = data.get('metrics', {})
+            all_metrics.append(metrics)
     
     # Sort by version number
     if versions:
@@ -91,6 +213,7 @@ def collect_metrics(programs_dir):
     
     versions = []
     all_metrics = []
+    versioned_files = []
     
     for program_file in program_files:
         # Extract version number from filename
@@ -100,20 +223,47 @@ def collect_metrics(programs_dir):
             
             # Look for corresponding evaluation file
             eval_file = program_file.with_suffix('').parent / f"{program_file.stem}_evaluation.txt"
-            
-            if eval_file.exists():
-                versions.append(version_num)
-                metrics = parse_evaluation_file(eval_file)
-                all_metrics.append(metrics)
-            else:
-                # If no evaluation file, create placeholder with None values
-                print(f"Warning: No evaluation file found for {program_file.name}")
-                versions.append(version_num)
-                all_metrics.append({})
+            versioned_files.append((version_num, program_file, eval_file))
+    
+    # Read and parse changed evaluation files concurrently; map() keeps them in order
+    eval_files = [f[2] for f in versioned_files]
+    cache = load_metrics_cache(programs_path)
+    with ThreadPoolExecutor() as executor:
+        parsed = list(executor.map(lambda p: load_cached(p, parse_evaluation_file, cache), eval_files))
+    save_metrics_cache(programs_path, cache, [p.name for p in eval_files])
+    
+    for (version_num, program_file, _), metrics in zip(versioned_files, parsed):
+        versions.append(version_num)
+        if metrics is not None:
+            all_metrics.append(metrics)
+        else:
+            # If no evaluation file, create placeholder with None values
+            print(f"Warning: No evaluation file found for {program_file.name}")
+            all_metrics.append({})
     
     return versions, all_metrics
 
 
+def metric_values(all_metrics, metric):
+    """Return one metric per version, with None for missing or zero (failed) values."""
+    return [val if (val := m.get(metric)) else None for m in all_metrics]
+
+
+def running_best(values, higher_is_better=True):
+    """Return the best value seen so far at each position.
+    
+    None and NaN entries (missing or failed runs) keep the previous best;
+    positions before the first real value are None.
+    """
+    sentinel = -math.inf if higher_is_better else math.inf
+    # NaN must not reach max/min, which would carry it forward from the front
+    best = itertools.accumulate(
+        (sentinel if val is None or val != val else val for val in values),
+        max if higher_is_better else min,
+    )
+    return [None if val == sentinel else val for val in best]
+
+
 def plot_metrics(versions, all_metrics, programs_dir, metric1='combined_score', metric2=None, 
                  metric2_higher_is_better=False, oe_versions=None, oe_metrics=None, output_file=None):
     """Plot one or two metrics. If metric2 is provided, use dual y-axes.
@@ -128,7 +278,7 @@ def plot_metrics(versions, all_metrics, programs_dir, metric1='combined_score',
         return
     
     # Extract metric1 values, treating 0 as None for failed runs
-    metric1_values = [m.get(metric1, None) if m.get(metric1, None) not in (0, 0.0) else None for m in all_metrics]
+    metric1_values = metric_values(all_metrics, metric1)
     
     # Debug output
     print(f"\nDEBUG: Plotting {metric1}")
@@ -137,12 +287,7 @@ def plot_metrics(versions, all_metrics, programs_dir, metric1='combined_score',
     print(f"  Non-None count: {sum(1 for v in metric1_values if v is not None)}")
     
     # Calculate running best for metric1 (higher is better)
-    best_metric1 = []
-    current_best = float('-inf')
-    for val in metric1_values:
-        if val is not None and val > current_best:
-            current_best = val
-        best_metric1.append(current_best if current_best != float('-inf') else None)
+    best_metric1 = running_best(metric1_values)
     
     # Create figure
     fig, ax1 = plt.subplots(figsize=(12, 6))
@@ -164,15 +309,10 @@ def plot_metrics(versions, all_metrics, programs_dir, metric1='combined_score',
     
     # Plot OpenEvolve data if provided
     if oe_versions and oe_metrics:
-        oe_metric1_values = [m.get(metric1, None) if m.get(metric1, None) not in (0, 0.0) else None for m in oe_metrics]
+        oe_metric1_values = metric_values(oe_metrics, metric1)
         
         # Calculate running best for OpenEvolve
-        oe_best_metric1 = []
-        current_best = float('-inf')
-        for val in oe_metric1_values:
-            if val is not None and val > current_best:
-                current_best = val
-            oe_best_metric1.append(current_best if current_best != float('-inf') else None)
+        oe_best_metric1 = running_best(oe_metric1_values)
         
         color_oe = 'tab:green'
         line_oe = ax1.plot(oe_versions, oe_metric1_values, 's-', color=color_oe, linewidth=2,
@@ -184,28 +324,14 @@ def plot_metrics(versions, all_metrics, programs_dir, metric1='combined_score',
     # Plot second metric if provided
     if metric2:
         # Extract metric2 values, treating 0 as None for failed runs
-        metric2_values = [m.get(metric2, None) if m.get(metric2, None) not in (0, 0.0) else None for m in all_metrics]
+        metric2_values = metric_values(all_metrics, metric2)
         
         print(f"\nDEBUG: Plotting {metric2}")
         print(f"  Values: {metric2_values}")
         print(f"  Non-None count: {sum(1 for v in metric2_values if v is not None)}")
         
         # Calculate running best for metric2
-        best_metric2 = []
-        if metric2_higher_is_better:
-            # Higher is better
-            current_best = float('-inf')
-            for val in metric2_values:
-                if val is not None and val > current_best:
-                    current_best = val
-                best_metric2.append(current_best if current_best != float('-inf') else None)
-        else:
-            # Lower is better (default)
-            current_best = float('inf')
-            for val in metric2_values:
-                if val is not None and val < current_best:
-                    current_best = val
-                best_metric2.append(current_best if current_best != float('inf') else None)
+        best_metric2 = running_best(metric2_values, metric2_higher_is_better)
         
         # Create second y-axis
         ax2 = ax1.twinx()
@@ -224,24 +350,10 @@ def plot_metrics(versions, all_metrics, programs_dir, metric1='combined_score',
         
         # Plot OpenEvolve metric2 if provided
         if oe_versions and oe_metrics:
-            oe_metric2_values = [m.get(metric2, None) if m.get(metric2, None) not in (0, 0.0) else None for m in oe_metrics]
+            oe_metric2_values = metric_values(oe_metrics, metric2)
             
             # Calculate running best for OpenEvolve metric2
-            oe_best_metric2 = []
-            if metric2_higher_is_better:
-                # Higher is better
-                current_best = float('-inf')
-                for val in oe_metric2_values:
-                    if val is not None and val > current_best:
-                        current_best = val
-                    oe_best_metric2.append(current_best if current_best != float('-inf') else None)
-            else:
-                # Lower is better (default)
-                current_best = float('inf')
-                for val in oe_metric2_values:
-                    if val is not None and val < current_best:
-                        current_best = val
-                    oe_best_metric2.append(current_best if current_best != float('inf') else None)
+            oe_best_metric2 = running_best(oe_metric2_values, metric2_higher_is_better)
             
             color_oe2 = 'tab:purple'
             line_oe2 = ax2.plot(oe_versions, oe_metric2_values, '^-', color=color_oe2, linewidth=2,